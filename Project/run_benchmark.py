@@ -0,0 +1,281 @@
+# Import necessary Python libraries
+import time
+import sys
+import os
+import json
+import statistics
+import subprocess
+import multiprocessing
+from run_mvc import RunMVC, MVC_METHODS
+
+# Define the optimal VC values of the instances in Project/DATA (Table 1 of the project description); the .sol files in
+# DATA/ExampleSolutions take precedence when they exist
+REFERENCE_OPT = {"jazz": 158, "karate": 14, "football": 94, "as-22july06": 3303, "hep-th": 3926, "star": 6902, "star2": 4542,
+                 "netscience": 899, "email": 594, "delaunay_n10": 703, "power": 2203}
+
+# Define the relative errors the qualified runtime distributions (QRTD) and the time-to-target values are computed for,
+# and the fractions of the cutoff time the solution quality distributions (SQD) are computed at
+QUALITIES = [0.0, 0.005, 0.01, 0.02, 0.05, 0.1]
+SQD_TIMES = [0.01, 0.1, 0.25, 0.5, 1.0]
+
+# Define how much worse a group of runs may get before the comparison against the baseline reports a regression: the mean relative
+# error may grow by REL_ERROR_TOLERANCE, the success rate at the optimum may drop by SUCCESS_TOLERANCE, and the median time to the
+# optimum may grow by the factor TIME_TOLERANCE plus TIME_SLACK seconds (so that runs of a few milliseconds do not count as noise)
+REL_ERROR_TOLERANCE = 0.001
+SUCCESS_TOLERANCE = 0.1
+TIME_TOLERANCE = 1.5
+TIME_SLACK = 0.1
+
+# Define the RunBenchmark class that runs a matrix of run_mvc.py runs (instances x mvc methods x seeds x cutoff times) in a process pool,
+# evaluates their .trace and .sol files against the reference optima, and compares the results with a stored baseline
+class RunBenchmark:
+
+    # The lower bound providers passed to every run through "-extra" (None if run_mvc.py's default is used)
+    bound = None
+
+    # This function reads the reference optimal VC values: REFERENCE_OPT, overridden by the first line of the .sol files in DATA/ExampleSolutions
+    def reference_optima(self, data_dir):
+        optima = dict(REFERENCE_OPT)
+        solution_dir = os.path.join(data_dir, "ExampleSolutions")
+        if os.path.isdir(solution_dir):
+            for name in os.listdir(solution_dir):
+                if name.endswith(".sol"):
+                    with open(os.path.join(solution_dir, name)) as f:
+                        optima[name[:-4]] = int(f.readline())
+        return optima
+
+    # This function lists the run matrix as (instance, mvc method, cutoff time, random seed) tuples; BnB does not use the random seed
+    # (its files are named without it), so it runs once per instance and cutoff time
+    def run_matrix(self, instances, methods, cutoffs, seeds):
+        runs = []
+        for inst in instances:
+            for mvc_method in methods:
+                for cutoff_time in cutoffs:
+                    for random_seed in (seeds[:1] if mvc_method == "BnB" else seeds):
+                        runs.append((inst, mvc_method, cutoff_time, random_seed))
+        return runs
+
+    # This function returns the names of the .sol and .trace files run_mvc.py writes for one run (named by run_mvc.py's own rule, with the
+    # lower bound providers of a "-bound" passed through "-extra")
+    def output_files(self, inst, mvc_method, cutoff_time, random_seed, bound=None):
+        return RunMVC().output_names(inst + ".graph", mvc_method, cutoff_time, random_seed, bound)
+
+    # This function executes one run of run_mvc.py in the output directory (run_dir, which links to the DATA folder) and returns the
+    # run with its wall-clock time and exit status (a run that exceeds twice its cutoff time plus 30 seconds is killed)
+    def execute(self, task):
+        run_dir, extra_args, run = task
+        inst, mvc_method, cutoff_time, random_seed = run
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_mvc.py")
+        args = [sys.executable, script, "exec", "-inst", inst + ".graph", "-alg", mvc_method, "-time", str(cutoff_time), "-seed", str(random_seed)] + extra_args
+        start = time.time()
+        try:
+            status = subprocess.run(args, cwd=run_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2 * cutoff_time + 30).returncode
+        except subprocess.TimeoutExpired:
+            status = "timeout"
+        return run, time.time() - start, status
+
+    # This function reads a .trace file into a list of (time, VC value) pairs
+    def read_trace(self, trace_file):
+        trace = []
+        with open(trace_file) as f:
+            for line in f:
+                if line.strip():
+                    t, size = line.split(",")
+                    trace.append((float(t), int(size)))
+        return trace
+
+    # This function reads a .sol file and checks that it is a vertex cover of G of the size written on its first line
+    def check_solution(self, sol_file, G):
+        with open(sol_file) as f:
+            size = int(f.readline())
+            line = f.readline().strip()
+        cover = bytearray(G.number_of_nodes() + 1)
+        for v in (line.split(",") if line else []):
+            cover[int(v)] = 1
+        return sum(cover) == size and all(cover[u] or cover[v] for u, v in G.edges())
+
+    # This function evaluates one finished run: its best VC value, relative error against the reference optimum, time of its last
+    # improvement, and its time to reach each relative error of QUALITIES (None if it never did)
+    def evaluate(self, run, wall_time, status, run_dir, optima, graphs):
+        inst, mvc_method, cutoff_time, random_seed = run
+        sol_file, trace_file = self.output_files(inst, mvc_method, cutoff_time, random_seed, self.bound)
+        row = {"inst": inst, "alg": mvc_method, "time": cutoff_time, "seed": random_seed, "status": status, "wall_time": wall_time,
+               "best": None, "opt": optima.get(inst), "rel_error": None, "best_time": None, "valid": False, "trace": [],
+               "time_to_target": {str(q): None for q in QUALITIES}}
+        if status != 0 or not os.path.exists(os.path.join(run_dir, trace_file)):
+            return row
+        trace = self.read_trace(os.path.join(run_dir, trace_file))
+        row["trace"] = trace
+        row["best"] = trace[-1][1]
+        row["best_time"] = trace[-1][0]
+        row["valid"] = self.check_solution(os.path.join(run_dir, sol_file), graphs[inst])
+        if row["opt"]:
+            row["rel_error"] = (row["best"] - row["opt"]) / row["opt"]
+            for q in QUALITIES:
+                for t, size in trace:
+                    if (size - row["opt"]) / row["opt"] <= q:
+                        row["time_to_target"][str(q)] = t
+                        break
+        return row
+
+    # This function summarizes the runs of each (instance, mvc method, cutoff time) group: mean and best relative error, the
+    # qualified runtime distribution (for each relative error of QUALITIES, the sorted times to reach it with the fraction of
+    # runs that reached it by then), the solution quality distribution (for each fraction of the cutoff time in SQD_TIMES,
+    # the sorted relative errors reached by then), the success rate and the median time to the optimum
+    def summarize(self, rows):
+        groups = {}
+        for row in rows:
+            groups.setdefault((row["inst"], row["alg"], row["time"]), []).append(row)
+        summary = []
+        for (inst, mvc_method, cutoff_time), group in sorted(groups.items()):
+            entry = {"inst": inst, "alg": mvc_method, "time": cutoff_time, "runs": len(group),
+                     "failed": sum(1 for row in group if row["status"] != 0 or not row["valid"]), "mean_rel_error": None,
+                     "best_rel_error": None, "success_rate": None, "median_time_to_opt": None, "qrtd": {}, "sqd": {}}
+            errors = [row["rel_error"] for row in group if row["rel_error"] is not None]
+            if errors and len(errors) == len(group):
+                entry["mean_rel_error"] = statistics.mean(errors)
+                entry["best_rel_error"] = min(errors)
+                for q in QUALITIES:
+                    times = sorted(row["time_to_target"][str(q)] for row in group if row["time_to_target"][str(q)] is not None)
+                    entry["qrtd"][str(q)] = [(t, (k + 1) / len(group)) for k, t in enumerate(times)]
+                entry["success_rate"] = len(entry["qrtd"]["0.0"]) / len(group)
+                if entry["qrtd"]["0.0"]:
+                    entry["median_time_to_opt"] = statistics.median(t for t, fraction in entry["qrtd"]["0.0"])
+                for fraction in SQD_TIMES:
+                    reached = []
+                    for row in group:
+                        sizes = [size for t, size in row["trace"] if t <= fraction * cutoff_time]
+                        if sizes:
+                            reached.append((sizes[-1] - row["opt"]) / row["opt"])
+                    reached.sort()
+                    entry["sqd"][str(fraction)] = [(q, (k + 1) / len(group)) for k, q in enumerate(reached)]
+            summary.append(entry)
+        return summary
+
+    # This function compares the summary with a baseline summary and returns one line per group that is in both,
+    # tagged REGRESSION if it got worse beyond the tolerances, IMPROVED if it got better, and ok otherwise
+    def compare(self, summary, baseline):
+        base = dict(((entry["inst"], entry["alg"], entry["time"]), entry) for entry in baseline)
+        report = []
+        for entry in summary:
+            key = (entry["inst"], entry["alg"], entry["time"])
+            if key not in base:
+                continue
+            old = base[key]
+            worse = []
+            better = []
+            if entry["failed"] > old["failed"]:
+                worse.append("failed runs " + str(old["failed"]) + " -> " + str(entry["failed"]))
+            if entry["mean_rel_error"] is not None and old["mean_rel_error"] is not None:
+                if entry["mean_rel_error"] > old["mean_rel_error"] + REL_ERROR_TOLERANCE:
+                    worse.append("mean rel error %.4f -> %.4f" % (old["mean_rel_error"], entry["mean_rel_error"]))
+                elif entry["mean_rel_error"] < old["mean_rel_error"] - REL_ERROR_TOLERANCE:
+                    better.append("mean rel error %.4f -> %.4f" % (old["mean_rel_error"], entry["mean_rel_error"]))
+            if entry["success_rate"] is not None and old["success_rate"] is not None:
+                if entry["success_rate"] < old["success_rate"] - SUCCESS_TOLERANCE:
+                    worse.append("success rate %.2f -> %.2f" % (old["success_rate"], entry["success_rate"]))
+                elif entry["success_rate"] > old["success_rate"] + SUCCESS_TOLERANCE:
+                    better.append("success rate %.2f -> %.2f" % (old["success_rate"], entry["success_rate"]))
+            if entry["median_time_to_opt"] is not None and old["median_time_to_opt"] is not None:
+                if entry["median_time_to_opt"] > old["median_time_to_opt"] * TIME_TOLERANCE + TIME_SLACK:
+                    worse.append("median time to opt %.3fs -> %.3fs" % (old["median_time_to_opt"], entry["median_time_to_opt"]))
+                elif entry["median_time_to_opt"] * TIME_TOLERANCE + TIME_SLACK < old["median_time_to_opt"]:
+                    better.append("median time to opt %.3fs -> %.3fs" % (old["median_time_to_opt"], entry["median_time_to_opt"]))
+            tag = "REGRESSION" if worse else ("IMPROVED" if better else "ok")
+            report.append(tag + " " + entry["inst"] + " " + entry["alg"] + " " + str(entry["time"]) + ("; " + "; ".join(worse + better) if worse or better else ""))
+        return report
+
+    # This function writes the runs as a tab-separated results table (one line per run)
+    def write_table(self, rows, table_file):
+        columns = ["inst", "alg", "time", "seed", "status", "valid", "best", "opt", "rel_error", "best_time", "wall_time"] + ["ttt_" + str(q) for q in QUALITIES]
+        with open(table_file, "w") as f:
+            f.write("\t".join(columns) + "\n")
+            for row in rows:
+                values = [row[c] for c in columns[:11]] + [row["time_to_target"][str(q)] for q in QUALITIES]
+                f.write("\t".join("" if value is None else str(value) for value in values) + "\n")
+
+    # This helper function collects the "-name value" pairs of the input arguments into a dictionary
+    def parse_options(self, args):
+        options = {}
+        for i in range(0, len(args) - 1):
+            if args[i].startswith("-"):
+                options[args[i][1:]] = args[i + 1]
+        return options
+
+    # This main() function contains modules of parsing input arguments, running the matrix in a process pool, and writing the results
+    # table, the results summary (JSON) and the comparison against the baseline
+    def main(self):
+        # Collect the "-name value" pairs of the input arguments into a dictionary (options)
+        options = self.parse_options(sys.argv[2:])
+
+        # Assign the instances ("all" for every .graph file in DATA), mvc methods, cutoff times and random seeds (comma separated lists)
+        data_dir = os.path.abspath(options.get("data", os.path.join(os.path.dirname(os.path.abspath(__file__)), "DATA")))
+        if options.get("inst", "all") == "all":
+            instances = sorted(name[:-6] for name in os.listdir(data_dir) if name.endswith(".graph"))
+        else:
+            instances = [name[:-6] if name.endswith(".graph") else name for name in options["inst"].split(",")]
+        methods = options.get("alg", "BnB,Approx,LS1,LS2").split(",")
+        cutoffs = [int(t) for t in options.get("time", "10").split(",")]
+        seeds = [int(s) for s in options.get("seed", "1,2,3").split(",")]
+        # Assign the number of parallel runs (one per CPU by default), the output directory, the baseline file, and the
+        # extra arguments passed on to every run of run_mvc.py (e.g. -extra "-reduce 1")
+        num_workers = int(options.get("workers", str(os.cpu_count() or 1)))
+        out_dir = os.path.abspath(options.get("out", "benchmark"))
+        baseline_file = options.get("baseline")
+        extra_args = options.get("extra", "").split()
+        self.bound = RunMVC().parse_options(extra_args).get("bound")
+
+        # Throw an error if an input mvc method is not in the method pool
+        if any(mvc_method not in MVC_METHODS for mvc_method in methods):
+            print("error: not correct input method")
+            exit(1)
+
+        # Create the output directory with a link to the DATA folder, where run_mvc.py finds the graphs and writes its files
+        run_dir = os.path.join(out_dir, "runs")
+        os.makedirs(run_dir, exist_ok=True)
+        if not os.path.exists(os.path.join(run_dir, "DATA")):
+            os.symlink(data_dir, os.path.join(run_dir, "DATA"))
+
+        # Load every instance once, which also builds the binary graph caches before the timed runs start
+        runmvc = RunMVC()
+        graphs = dict((inst, runmvc.load_graph(os.path.join(data_dir, inst + ".graph"))) for inst in instances)
+        optima = self.reference_optima(data_dir)
+
+        # Run the matrix in a pool of worker processes, longest cutoff time first
+        runs = self.run_matrix(instances, methods, cutoffs, seeds)
+        runs.sort(key=lambda run: -run[2])
+        with multiprocessing.Pool(num_workers) as pool:
+            finished = pool.map(self.execute, [(run_dir, extra_args, run) for run in runs], chunksize=1)
+
+        # Evaluate the runs and summarize them per group
+        rows = [self.evaluate(run, wall_time, status, run_dir, optima, graphs) for run, wall_time, status in finished]
+        rows.sort(key=lambda row: (row["inst"], row["alg"], row["time"], row["seed"]))
+        summary = self.summarize(rows)
+
+        # Write the results table and the results summary
+        self.write_table(rows, os.path.join(out_dir, "results.tsv"))
+        with open(os.path.join(out_dir, "results.json"), "w") as f:
+            json.dump({"runs": rows, "summary": summary}, f, indent=1)
+        for entry in summary:
+            print(entry["inst"] + " " + entry["alg"] + " " + str(entry["time"]) + ": " + str(entry["runs"]) + " runs, " + str(entry["failed"]) + " failed, mean rel error " +
+                  ("-" if entry["mean_rel_error"] is None else "%.4f" % entry["mean_rel_error"]) + ", success rate " +
+                  ("-" if entry["success_rate"] is None else "%.2f" % entry["success_rate"]))
+
+        # Compare with the baseline if it exists (exit status 2 on a regression), otherwise store the summary as the baseline
+        if baseline_file:
+            if os.path.exists(baseline_file):
+                with open(baseline_file) as f:
+                    report = self.compare(summary, json.load(f)["summary"])
+                for line in report:
+                    print(line)
+                if any(line.startswith("REGRESSION") for line in report):
+                    exit(2)
+            else:
+                with open(baseline_file, "w") as f:
+                    json.dump({"summary": summary}, f, indent=1)
+                print("baseline written to " + baseline_file)
+
+# Initialize the RunBenchmark() class and execute the main() function
+if __name__ == '__main__':
+    runbenchmark = RunBenchmark()
+    runbenchmark.main()
@@ -1,141 +1,1325 @@
 # Import necessary Python libraries
-import networkx as nx
 import time
 import sys
 import random
-import queue
 import math
-from copy import deepcopy as dc
+import os
+import mmap
+import struct
+import json
+import hashlib
+import queue
+import multiprocessing
+from array import array
+# The solution store locks its files with fcntl where it is available (POSIX); elsewhere updates are still atomic but not serialized
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Define the layout of the binary graph cache (.graph.bin) header: magic, format version, vertex count, edge count,
+# and the size and modification time (ns) of the source .graph file, padded to 64 bytes so the arrays stay 8-byte aligned
+CACHE_MAGIC = b'MVCCSR01'
+CACHE_HEADER = struct.Struct('<8sqqqqq16x')
+
+# Define the mvc methods that can be selected with the "-alg" input argument
+MVC_METHODS = ["BnB", "Approx", "ApproxGreedy", "LS1", "LS2", "LS3", "Portfolio"]
+
+# Define the mvc methods the workers of a portfolio run ("-alg Portfolio -portfolio N") cycle through, and how many seconds pass
+# between two exchanges of the best MVC solution between a worker and the others
+PORTFOLIO_METHODS = ["LS3", "BnB", "LS3", "LS2", "LS3", "LS1"]
+SYNC_INTERVAL = 0.1
+
+# Define the parameters of the edge-weighting local search (LS3): the number of random cover vertices compared to pick the one to remove,
+# the average edge weight that triggers forgetting, the factor the edge weights are scaled by when forgetting, and how many steps pass between clock reads
+REMOVE_SAMPLES = 50
+WEIGHT_THRESHOLD = 50
+WEIGHT_FORGET = 0.3
+CLOCK_CHECK_INTERVAL = 64
+
+# Define how much work (adjacency entries scanned and vertex pairs compared) the local search of the dynamic mode ("-changes") may spend
+# around the changed vertices after each update
+DYNAMIC_BUDGET = 4096
+
+# Define the CSRGraph class that stores an undirected graph in compressed sparse row (CSR) form:
+# the neighbors of vertex v (vertex IDs run from 1 to num_ver) are adjacency[offsets[v]:offsets[v + 1]]
+class CSRGraph:
+
+    # This function initializes the graph with its vertex count, edge count, offsets array and adjacency (neighbors) array
+    # (cache_file is set when the two arrays are zero-copy views of a memory-mapped binary graph cache)
+    def __init__(self, num_ver, num_edg, offsets, adjacency, cache_file=None):
+        self.num_ver = num_ver
+        self.num_edg = num_edg
+        self.offsets = offsets
+        self.adjacency = adjacency
+        self.cache_file = cache_file
+
+    # This function makes a memory-mapped graph picklable by re-mapping its cache file in the receiving process,
+    # so parallel workers share one read-only copy of the arrays through the page cache instead of each holding its own
+    def __reduce__(self):
+        if self.cache_file is not None:
+            return (CSRGraph.from_cache, (self.cache_file,))
+        return (CSRGraph, (self.num_ver, self.num_edg, self.offsets, self.adjacency))
+
+    # This function writes the graph to a binary cache file (header, offsets, adjacency) tagged with the size and mtime of its source file
+    def to_cache(self, cache_file, src_size, src_mtime):
+        # Write to a temporary file first and rename it, so concurrent readers never see a partially written cache
+        tmp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, sys.byteorder == 'little', self.num_ver, self.num_edg, src_size, src_mtime))
+            array('q', self.offsets).tofile(f)
+            array('i', self.adjacency).tofile(f)
+        os.replace(tmp_file, cache_file)
+
+    # This function builds a CSRGraph from adjacency lists (adj_lists[v] holds the neighbors of vertex v, adj_lists[0] is unused)
+    @classmethod
+    def from_adjacency(cls, adj_lists):
+        offsets = array('q', [0, 0])
+        adjacency = array('i')
+        for v in range(1, len(adj_lists)):
+            adjacency.extend(array('i', adj_lists[v]))
+            offsets.append(len(adjacency))
+        return cls(len(adj_lists) - 1, len(adjacency) // 2, offsets, adjacency)
+
+    # This function memory-maps a binary cache file and returns a CSRGraph whose arrays are zero-copy views of the mapping
+    @classmethod
+    def from_cache(cls, cache_file):
+        with open(cache_file, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, little_endian, num_ver, num_edg, src_size, src_mtime = CACHE_HEADER.unpack_from(buf)
+        # Compute where the offsets array ends and check that the file holds exactly the header and the two arrays
+        offsets_end = CACHE_HEADER.size + 8 * (num_ver + 2)
+        if magic != CACHE_MAGIC or little_endian != (sys.byteorder == 'little') or len(buf) < offsets_end:
+            buf.close()
+            raise ValueError("invalid graph cache file: " + cache_file)
+        view = memoryview(buf)
+        offsets = view[CACHE_HEADER.size:offsets_end].cast('q')
+        if len(buf) != offsets_end + 4 * offsets[num_ver + 1]:
+            offsets.release()
+            view.release()
+            buf.close()
+            raise ValueError("invalid graph cache file: " + cache_file)
+        adjacency = view[offsets_end:].cast('i')
+        return cls(num_ver, num_edg, offsets, adjacency, cache_file)
+
+    # This function reads only the header of a binary cache file and returns the size and mtime of the source file it was built from
+    @staticmethod
+    def cache_source_stat(cache_file):
+        with open(cache_file, 'rb') as f:
+            magic, little_endian, num_ver, num_edg, src_size, src_mtime = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+        return src_size, src_mtime
+
+    # This function returns the vertex IDs of the graph (a range, so no list is materialized)
+    def nodes(self):
+        return range(1, self.num_ver + 1)
+
+    # This function returns the total number of vertices of the graph
+    def number_of_nodes(self):
+        return self.num_ver
+
+    # This function returns the total number of edges of the graph
+    def number_of_edges(self):
+        return self.num_edg
+
+    # This function returns the degree of vertex v
+    def degree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    # This function returns all the (vertex, vertex's degree) pairs of the graph
+    def degrees(self):
+        offsets = self.offsets
+        return [(v, offsets[v + 1] - offsets[v]) for v in range(1, self.num_ver + 1)]
+
+    # This function returns the neighbors of vertex v (a slice of the adjacency array)
+    def neighbors(self, v):
+        return self.adjacency[self.offsets[v]:self.offsets[v + 1]]
+
+    # This function yields every edge (u, v) of the graph exactly once (with u < v)
+    def edges(self):
+        offsets = self.offsets
+        adjacency = self.adjacency
+        for u in range(1, self.num_ver + 1):
+            for i in range(offsets[u], offsets[u + 1]):
+                if u < adjacency[i]:
+                    yield (u, adjacency[i])
+
+# Define the lower bound providers of branch_and_bound: each provider shares the remaining graph state of the search
+# (G, removed-vertex flags, current degrees and remaining edge count), is told about every vertex removal through remove(v, trail),
+# pushes (provider, data) entries on the undo trail for the changes it makes, reverts them in undo(data), and returns
+# a lower bound on the number of vertices needed to cover the remaining graph in bound()
+
+# Define the MatchingBound provider: the size of a greedy maximal matching of the remaining graph, kept maximal as vertices are removed
+class MatchingBound:
+
+    # This function initializes a greedy maximal matching (mate[v] is the vertex matched with v, 0 if unmatched)
+    def __init__(self, G, removed, deg, rem_edges):
+        self.G = G
+        self.removed = removed
+        self.mate = [0] * (G.number_of_nodes() + 1)
+        self.size = 0
+        for u, v in G.edges():
+            if self.mate[u] == 0 and self.mate[v] == 0:
+                self.mate[u] = v
+                self.mate[v] = u
+                self.size += 1
+
+    # This function drops the matched edge of the removed vertex v and tries to re-match its partner w with a free neighbor of w
+    def remove(self, v, trail):
+        mate = self.mate
+        w = mate[v]
+        if w:
+            mate[v] = 0
+            mate[w] = 0
+            self.size -= 1
+            trail.append((self, (v, w, True)))
+            offsets = self.G.offsets
+            adjacency = self.G.adjacency
+            removed = self.removed
+            for i in range(offsets[w], offsets[w + 1]):
+                x = adjacency[i]
+                if not removed[x] and mate[x] == 0:
+                    mate[w] = x
+                    mate[x] = w
+                    self.size += 1
+                    trail.append((self, (w, x, False)))
+                    break
+
+    # This function restores a matched edge (u, w) that was dropped or drops one that was added
+    def undo(self, data):
+        u, w, dropped = data
+        if dropped:
+            self.mate[u] = w
+            self.mate[w] = u
+            self.size += 1
+        else:
+            self.mate[u] = 0
+            self.mate[w] = 0
+            self.size -= 1
+
+    # This function returns the size of the maximal matching (every matched edge needs its own cover vertex)
+    def bound(self):
+        return self.size
+
+# Define the CliqueCoverBound provider: a greedy partition of the vertices into cliques, where a clique of s remaining vertices needs s - 1 cover vertices
+# (the partition is computed once, removing a vertex only shrinks its clique, and a shrunk clique is still a clique)
+class CliqueCoverBound:
+
+    # This function initializes the clique partition of G
+    def __init__(self, G, removed, deg, rem_edges):
+        self.G = G
+        self.removed = removed
+        self.deg = deg
+        self.partition()
+
+    # This helper function greedily assigns every remaining vertex (in descending order of current degree) to the largest clique
+    # whose members are all its neighbors, or to a new clique
+    def partition(self):
+        G = self.G
+        removed = self.removed
+        clique_of = [0] * (G.number_of_nodes() + 1)
+        size = [0]
+        for v in sorted((v for v in G.nodes() if not removed[v]), key=lambda v: -self.deg[v]):
+            # Count how many members of each neighboring clique are adjacent to v
+            hits = {}
+            for u in G.neighbors(v):
+                if clique_of[u]:
+                    hits[clique_of[u]] = hits.get(clique_of[u], 0) + 1
+            # Join the largest clique that v is fully adjacent to, or open a new clique
+            best = 0
+            for c, count in hits.items():
+                if count == size[c] and (best == 0 or size[c] > size[best]):
+                    best = c
+            if best == 0:
+                size.append(0)
+                best = len(size) - 1
+            clique_of[v] = best
+            size[best] += 1
+        self.clique_of = clique_of
+        self.size = size
+        self.total = sum(s - 1 for s in size[1:] if s > 1)
+
+    # This function recomputes the partition on the remaining graph (whose cliques are usually larger than the shrunk ones)
+    # and records the old partition on the undo trail; it costs O(E), so branch_and_bound only calls it when the cheap bound nearly prunes
+    def tighten(self, trail):
+        trail.append((self, (self.clique_of, self.size, self.total)))
+        self.partition()
+        return self.total
+
+    # This function shrinks the clique of the removed vertex v
+    def remove(self, v, trail):
+        c = self.clique_of[v]
+        self.size[c] -= 1
+        if self.size[c] >= 1:
+            self.total -= 1
+        trail.append((self, v))
+
+    # This function puts vertex v back into its clique, or restores the partition replaced by tighten
+    def undo(self, v):
+        if type(v) is tuple:
+            self.clique_of, self.size, self.total = v
+            return
+        c = self.clique_of[v]
+        self.size[c] += 1
+        if self.size[c] >= 2:
+            self.total += 1
+
+    # This function returns the number of cover vertices the cliques need in total
+    def bound(self):
+        return self.total
+
+# Define the DegreeBound provider: the fewest vertices whose current degrees can add up to the remaining edge count
+# (computed from a histogram of the current degrees, scanned from the highest degree downwards)
+class DegreeBound:
+
+    # This function initializes the degree histogram (count[d] is the number of remaining vertices of current degree d)
+    def __init__(self, G, removed, deg, rem_edges):
+        self.G = G
+        self.removed = removed
+        self.deg = deg
+        self.rem_edges = rem_edges
+        self.top = max(deg)
+        self.count = [0] * (self.top + 1)
+        for v in G.nodes():
+            self.count[deg[v]] += 1
+
+    # This function moves the removed vertex v and its remaining neighbors (whose degrees dropped by one) in the histogram
+    def remove(self, v, trail):
+        count = self.count
+        deg = self.deg
+        removed = self.removed
+        offsets = self.G.offsets
+        adjacency = self.G.adjacency
+        count[deg[v]] -= 1
+        for i in range(offsets[v], offsets[v + 1]):
+            u = adjacency[i]
+            if not removed[u]:
+                count[deg[u] + 1] -= 1
+                count[deg[u]] += 1
+        trail.append((self, v))
+
+    # This function moves vertex v and its remaining neighbors back in the histogram
+    def undo(self, v):
+        count = self.count
+        deg = self.deg
+        removed = self.removed
+        offsets = self.G.offsets
+        adjacency = self.G.adjacency
+        count[deg[v]] += 1
+        top = max(self.top, deg[v])
+        for i in range(offsets[v], offsets[v + 1]):
+            u = adjacency[i]
+            if not removed[u]:
+                count[deg[u]] -= 1
+                count[deg[u] + 1] += 1
+                top = max(top, deg[u] + 1)
+        self.top = top
+
+    # This function takes vertices from the highest current degree downwards until their degrees add up to the remaining edge count
+    def bound(self):
+        count = self.count
+        # Lower the highest current degree (degrees only drop while the search goes deeper)
+        while self.top > 0 and count[self.top] == 0:
+            self.top -= 1
+        left = self.rem_edges[0]
+        k = 0
+        for d in range(self.top, 0, -1):
+            if left <= 0:
+                break
+            if count[d] * d >= left:
+                return k + (left + d - 1) // d
+            k += count[d]
+            left -= count[d] * d
+        return k
+
+# Define the LPBound provider: the optimum of the LP relaxation, which is half the size of a maximum matching of the bipartite double cover
+# (left copy of v adjacent to the right copies of N(v)); the matching is repaired with augmenting path searches as vertices are removed
+class LPBound:
+
+    # This function initializes a maximum matching of the double cover (mateL[v] / mateR[v] is the partner of the left / right copy of v, 0 if unmatched)
+    def __init__(self, G, removed, deg, rem_edges):
+        self.G = G
+        self.removed = removed
+        num_ver = G.number_of_nodes()
+        mateL, mateR = RunMVC().max_bipartite_matching(G.nodes(), [()] + [G.neighbors(v) for v in G.nodes()])
+        self.mateL = [0] + [mateL[v] for v in G.nodes()]
+        self.mateR = [0] + [mateR[v] for v in G.nodes()]
+        self.size = sum(1 for v in G.nodes() if mateL[v])
+        # Initialize the visit stamps of the augmenting path searches
+        self.seen = [0] * (num_ver + 1)
+        self.stamp = 0
+
+    # This function deletes the two copies of the removed vertex v one after the other and repairs the matching after each deletion:
+    # when one matched copy is deleted, an augmenting path of the smaller double cover has to end at the partner it leaves free
+    def remove(self, v, trail):
+        mateL = self.mateL
+        mateR = self.mateR
+        # Delete the right copy of v (the search treats it as removed, while the left copy of v may still take part in it)
+        freed_left = mateR[v]
+        if freed_left:
+            self.set_mate(mateR, v, 0, trail)
+            self.set_mate(mateL, freed_left, 0, trail)
+            self.augment(freed_left, mateL, mateR, trail)
+        # Delete the left copy of v (its partner may have changed while the right copy was repaired) and search backwards from its partner
+        freed_right = mateL[v]
+        if freed_right:
+            self.set_mate(mateL, v, 0, trail)
+            self.set_mate(mateR, freed_right, 0, trail)
+            self.augment(freed_right, mateR, mateL, trail)
+
+    # This helper function sets mate[u] = w and records the old partner of u on the undo trail (the matching size follows the left copies)
+    def set_mate(self, mate, u, w, trail):
+        trail.append((self, (mate, u, mate[u])))
+        if mate is self.mateL:
+            self.size += (w != 0) - (mate[u] != 0)
+        mate[u] = w
+
+    # This helper function searches an augmenting path from the free copy root (mate_from is the matching of root's side, mate_to of the
+    # other side) with an iterative depth-first search and flips the matching along it
+    def augment(self, root, mate_from, mate_to, trail):
+        offsets = self.G.offsets
+        adjacency = self.G.adjacency
+        removed = self.removed
+        seen = self.seen
+        self.stamp += 1
+        stamp = self.stamp
+        # Each stack entry is [vertex on root's side, index of its next neighbor to try, other-side vertex used to reach the next entry]
+        stack = [[root, offsets[root], 0]]
+        while stack:
+            frame = stack[-1]
+            v = frame[0]
+            if frame[1] == offsets[v + 1]:
+                stack.pop()
+                continue
+            w = adjacency[frame[1]]
+            frame[1] += 1
+            if removed[w] or seen[w] == stamp:
+                continue
+            seen[w] = stamp
+            frame[2] = w
+            if mate_to[w] == 0:
+                # Flip the matching along the path
+                for u, i, x in stack:
+                    self.set_mate(mate_from, u, x, trail)
+                    self.set_mate(mate_to, x, u, trail)
+                return True
+            stack.append([mate_to[w], offsets[mate_to[w]], 0])
+        return False
+
+    # This function reverts one partner change
+    def undo(self, data):
+        mate, u, w = data
+        if mate is self.mateL:
+            self.size += (w != 0) - (mate[u] != 0)
+        mate[u] = w
+
+    # This function returns the LP optimum rounded up (half the size of the maximum matching of the double cover)
+    def bound(self):
+        return (self.size + 1) // 2
+
+# Define how close (in cover vertices) the cheap lower bound has to come to the upper bound before branch_and_bound asks the providers to tighten it
+TIGHTEN_GAP = 10
+
+# Define the lower bound providers that can be selected with the "-bound" input argument (several can be combined as "lp,clique")
+BOUND_PROVIDERS = {"matching": MatchingBound, "clique": CliqueCoverBound, "degree": DegreeBound, "lp": LPBound}
+
+# Define the SolutionStore class that keeps the best known vertex cover of every graph in a directory, as one .sol file per graph named
+# by a content hash of its CSR arrays (so a renamed or copied graph file finds its solutions, and a changed one does not). Covers are
+# verified against the graph whenever they are loaded or saved, and a save only replaces the stored cover if it is smaller, under a
+# lock file and by renaming a temporary file, so concurrent runs never lose an improvement or see a partially written file
+class SolutionStore:
+
+    # This function opens (and creates) the store directory
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+
+    # This function returns the content hash of G (SHA-256 of its vertex count, offsets array and adjacency array)
+    def key(self, G):
+        digest = hashlib.sha256(struct.pack('<q', G.number_of_nodes()))
+        digest.update(G.offsets)
+        digest.update(G.adjacency)
+        return digest.hexdigest()
+
+    # This function checks that vertex_cover is a vertex cover of G (every vertex ID is valid and every edge has a covered end point)
+    def verify(self, G, vertex_cover):
+        num_ver = G.number_of_nodes()
+        covered = bytearray(num_ver + 1)
+        for v in vertex_cover:
+            if v < 1 or v > num_ver:
+                return False
+            covered[v] = 1
+        offsets = G.offsets
+        adjacency = G.adjacency
+        for u in range(1, num_ver + 1):
+            if not covered[u]:
+                for i in range(offsets[u], offsets[u + 1]):
+                    if not covered[adjacency[i]]:
+                        return False
+        return True
+
+    # This function reads a .sol file (size on the first line, comma separated vertex IDs on the second) and returns its vertices,
+    # or None if the file is missing or malformed
+    def read_sol(self, sol_file):
+        try:
+            with open(sol_file) as f:
+                size = int(f.readline())
+                line = f.readline().strip()
+            vertex_cover = [int(v) for v in line.split(",")] if line else []
+        except (OSError, ValueError):
+            return None
+        return vertex_cover if len(vertex_cover) == size else None
+
+    # This function returns the stored cover of G as (size, vertices) if there is one and it is a valid vertex cover of G, otherwise None
+    def load(self, G):
+        vertex_cover = self.read_sol(os.path.join(self.store_dir, self.key(G) + ".sol"))
+        if vertex_cover is None or not self.verify(G, vertex_cover):
+            return None
+        return len(vertex_cover), vertex_cover
+
+    # This function stores vertex_cover for G if it is a valid vertex cover and smaller than the stored one, and returns whether it did
+    def save(self, G, vertex_cover):
+        if not self.verify(G, vertex_cover):
+            return False
+        key = self.key(G)
+        sol_file = os.path.join(self.store_dir, key + ".sol")
+        with open(os.path.join(self.store_dir, key + ".lock"), 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            stored = self.read_sol(sol_file)
+            if stored is not None and len(stored) <= len(vertex_cover) and self.verify(G, stored):
+                return False
+            tmp_file = sol_file + '.' + str(os.getpid()) + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(str(len(vertex_cover)) + "\n")
+                f.write(",".join(str(v) for v in sorted(vertex_cover)))
+            os.replace(tmp_file, sol_file)
+        return True
+
+# Define the SolverStats class that collects the instrumentation of a run when it is turned on (RunMVC.stats is None otherwise): the
+# counters of every mvc method, which the solvers count in local variables and report every CLOCK_CHECK_INTERVAL iterations and when they
+# finish, the seconds spent in each phase (parse, reduce, search, write), and the callbacks that receive the collected data as
+# callback(event, data) with event "progress" (at most every interval seconds while a solver reports its counters) or "phase"
+class SolverStats:
+
+    # This function initializes empty counters and phase timers
+    def __init__(self, interval=1.0):
+        self.counters = {}
+        self.phases = {}
+        self.callbacks = []
+        self.interval = interval
+        self.last_progress = time.time()
+
+    # This function leaves the callbacks behind when the statistics are sent to a worker process (they may not be picklable)
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["callbacks"] = []
+        return state
+
+    # This function registers a callback
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    # This function records the current counters of an mvc method and notifies the callbacks if interval seconds have passed
+    def count(self, mvc_method, **counters):
+        self.counters[mvc_method] = counters
+        if self.callbacks and time.time() - self.last_progress >= self.interval:
+            self.last_progress = time.time()
+            self.notify("progress")
+
+    # This function adds the seconds spent in a phase and notifies the callbacks
+    def phase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self.notify("phase")
+
+    # This function adds the counters collected by a worker process (a dictionary of counters per mvc method)
+    def merge(self, counters):
+        for mvc_method in counters:
+            totals = self.counters.setdefault(mvc_method, {})
+            for name, value in counters[mvc_method].items():
+                totals[name] = totals.get(name, 0) + value
+
+    # This function passes a copy of the collected data to every callback
+    def notify(self, event):
+        for callback in self.callbacks:
+            callback(event, self.snapshot())
+
+    # This function returns a copy of the collected data as {"counters": {mvc method: {name: value}}, "phases": {name: seconds}}
+    def snapshot(self):
+        return {"counters": dict((mvc_method, dict(values)) for mvc_method, values in self.counters.items()), "phases": dict(self.phases)}
+
+# Define the TraceLog class, a list of improved solutions (time, VC value) that also passes every appended pair to a callback,
+# so that the improvements of a solver can be streamed while it runs (see RunMVC.trace_callback)
+class TraceLog(list):
+
+    # This function initializes an empty list with its callback
+    def __init__(self, callback):
+        list.__init__(self)
+        self.callback = callback
+
+    # This function appends an improved solution and passes it to the callback
+    def append(self, entry):
+        list.append(self, entry)
+        self.callback(entry)
+
+# Define the SharedIncumbent class that holds the best MVC solution found by the workers of a portfolio run in shared memory:
+# its size (size, which also carries the lock) and the in-cover flags of its vertices (cover), starting from the cover of all the vertices
+class SharedIncumbent:
+
+    # This function allocates the shared size and flags for a graph with num_ver vertices
+    def __init__(self, num_ver):
+        self.size = multiprocessing.Value('q', num_ver)
+        self.cover = multiprocessing.RawArray('B', b'\x00' + b'\x01' * num_ver)
+
+    # This function returns the size of the shared best MVC solution
+    def best_size(self):
+        return self.size.value
+
+    # This function replaces the shared best MVC solution with vertex_cover if it is still smaller once the lock is held
+    def publish(self, size, vertex_cover):
+        with self.size.get_lock():
+            if size < self.size.value:
+                flags = bytearray(len(self.cover))
+                for v in vertex_cover:
+                    flags[v] = 1
+                self.cover[:] = flags
+                self.size.value = size
+
+    # This function returns the shared best MVC solution as (size, list of vertices)
+    def fetch(self):
+        with self.size.get_lock():
+            size = self.size.value
+            flags = bytes(self.cover)
+        return size, [v for v in range(1, len(flags)) if flags[v]]
+
+# Define the WorkStealing class that lets the BnB workers of a portfolio run split one search tree: a worker that runs out of work
+# becomes idle and waits on a shared queue of subproblems, and busy workers that see idle workers waiting donate the open branch at the
+# bottom of their stack (the largest subproblem they hold). A subproblem is sent as a bitset of the removed vertices and the partial cover
+# (an array of vertex IDs), and the search is finished when all the workers are idle and no subproblem is queued. The shared state is the
+# number of idle workers and the number of queued subproblems
+class WorkStealing:
+
+    # This function allocates the shared queue and counters for num_workers BnB workers
+    def __init__(self, num_workers):
+        self.num_workers = num_workers
+        self.queue = multiprocessing.Queue()
+        self.state = multiprocessing.Array('i', [0, 0])
+
+    # This function tells a busy worker whether more workers are waiting than subproblems are queued (read without taking the lock)
+    def hungry(self):
+        state = self.state.get_obj()
+        return state[0] > state[1]
+
+    # This function queues a subproblem (removed-vertex bitset and partial cover, both as bytes)
+    def donate(self, removed_bits, cover):
+        with self.state.get_lock():
+            self.state[1] += 1
+        self.queue.put((removed_bits, cover))
+
+    # This function waits for a subproblem until the deadline and returns it, or returns None if the deadline passed or the search is finished
+    def take(self, deadline):
+        with self.state.get_lock():
+            self.state[0] += 1
+        while time.time() < deadline:
+            with self.state.get_lock():
+                # Claim a queued subproblem (it may still be on its way through the queue, so get() waits for it)
+                if self.state[1] > 0:
+                    self.state[1] -= 1
+                    self.state[0] -= 1
+                    return self.queue.get()
+                # Every worker is idle and nothing is queued: the whole search tree has been explored
+                if self.state[0] == self.num_workers:
+                    return None
+            time.sleep(0.001)
+        return None
+
+# Define the DynamicCover class that keeps a vertex cover of a changing graph valid and near-minimal: the graph is held as adjacency sets,
+# and free[v] counts the neighbors of v that are not in the cover (a vertex outside the cover always has free[v] = 0, a cover vertex
+# with free[v] = 0 is redundant). After every edge insertion or deletion the cover is repaired locally and then improved by a local
+# search bounded by DYNAMIC_BUDGET that starts from the changed vertices: it removes redundant cover vertices and applies
+# 2-improvements (a vertex x outside the cover whose two non-adjacent cover neighbors a and b have x as their only free neighbor
+# enters the cover and a and b leave it)
+class DynamicCover:
+
+    # This function builds the adjacency sets and free counts of G for its vertex cover vertex_cover
+    def __init__(self, G, vertex_cover):
+        num_ver = G.number_of_nodes()
+        self.adj = [set(G.neighbors(v)) if v > 0 else set() for v in range(num_ver + 1)]
+        self.in_cover = bytearray(num_ver + 1)
+        for v in vertex_cover:
+            self.in_cover[v] = 1
+        self.size = len(vertex_cover)
+        self.free = array('i', [0] * (num_ver + 1))
+        for v in range(1, num_ver + 1):
+            if not self.in_cover[v]:
+                for u in self.adj[v]:
+                    self.free[u] += 1
+        # Count the work of the updates (repairs: vertices added to restore validity, improvements: vertices saved by the local search)
+        self.counters = {"inserts": 0, "deletes": 0, "repairs": 0, "removals": 0, "two_improvements": 0, "work": 0}
+
+    # This function makes room for the vertices up to v (a change may add vertices that are not in the initial graph)
+    def grow(self, v):
+        while len(self.adj) <= v:
+            self.adj.append(set())
+            self.in_cover.append(0)
+            self.free.append(0)
+
+    # This function adds v to the cover
+    def add(self, v):
+        self.in_cover[v] = 1
+        self.size += 1
+        for u in self.adj[v]:
+            self.free[u] -= 1
+
+    # This function removes v from the cover
+    def remove(self, v):
+        self.in_cover[v] = 0
+        self.size -= 1
+        for u in self.adj[v]:
+            self.free[u] += 1
+
+    # This function inserts the edge (u, v); if neither end is in the cover, the end of higher degree is added to cover it
+    def insert(self, u, v):
+        self.grow(max(u, v))
+        if u == v or v in self.adj[u]:
+            return
+        self.counters["inserts"] += 1
+        self.adj[u].add(v)
+        self.adj[v].add(u)
+        if not self.in_cover[v]:
+            self.free[u] += 1
+        if not self.in_cover[u]:
+            self.free[v] += 1
+        if self.in_cover[u] or self.in_cover[v]:
+            self.improve([u, v])
+            return
+        if len(self.adj[u]) < len(self.adj[v]):
+            u, v = v, u
+        self.counters["repairs"] += 1
+        self.add(u)
+        # The neighbors of u may have become redundant, and v may now be the center of a 2-improvement
+        self.improve([v] + [w for w in self.adj[u] if self.in_cover[w] and self.free[w] == 0])
+
+    # This function deletes the edge (u, v); the cover stays valid and an end that is in the cover may become redundant
+    def delete(self, u, v):
+        if max(u, v) >= len(self.adj) or v not in self.adj[u]:
+            return
+        self.counters["deletes"] += 1
+        self.adj[u].discard(v)
+        self.adj[v].discard(u)
+        if not self.in_cover[v]:
+            self.free[u] -= 1
+        if not self.in_cover[u]:
+            self.free[v] -= 1
+        self.improve([u, v])
+
+    # This function runs the local search from the seed vertices until no candidate is left or the work reaches DYNAMIC_BUDGET
+    def improve(self, seeds):
+        adj = self.adj
+        in_cover = self.in_cover
+        free = self.free
+        queue = list(seeds)
+        queued = set(queue)
+        work = 0
+        while queue and work < DYNAMIC_BUDGET:
+            x = queue.pop()
+            queued.discard(x)
+            pushed = []
+            if in_cover[x]:
+                if free[x] == 0:
+                    # Remove the redundant cover vertex x, which may then be the center of a 2-improvement
+                    self.remove(x)
+                    self.counters["removals"] += 1
+                    work += len(adj[x])
+                    pushed.append(x)
+                elif free[x] == 1:
+                    # Look at the only free neighbor of x as the center of a 2-improvement
+                    work += len(adj[x])
+                    pushed.extend(y for y in adj[x] if not in_cover[y])
+            else:
+                # Collect the cover neighbors of x whose only free neighbor is x and look for two of them that are not adjacent
+                work += len(adj[x])
+                tight = [a for a in adj[x] if free[a] == 1]
+                pair = None
+                for i in range(len(tight)):
+                    a = tight[i]
+                    for j in range(i + 1, len(tight)):
+                        work += 1
+                        if tight[j] not in adj[a]:
+                            pair = (a, tight[j])
+                            break
+                    if pair is not None or work >= DYNAMIC_BUDGET:
+                        break
+                if pair is not None:
+                    self.add(x)
+                    self.remove(pair[0])
+                    self.remove(pair[1])
+                    self.counters["two_improvements"] += 1
+                    work += len(adj[x]) + len(adj[pair[0]]) + len(adj[pair[1]])
+                    # The leaving vertices may be centers of further 2-improvements, and the cover neighbors of x may have become redundant
+                    pushed.extend(pair)
+                    pushed.extend(w for w in adj[x] if in_cover[w] and free[w] == 0)
+            for y in pushed:
+                if y not in queued:
+                    queued.add(y)
+                    queue.append(y)
+        self.counters["work"] += work
+
+    # This function returns the vertices of the cover
+    def cover(self):
+        return [v for v in range(1, len(self.in_cover)) if self.in_cover[v]]
 
 # Define the RunMVC class that contains a graph parsing function, four mvc method (BnB|Approx|LS1 (HC)|LS2 (SA)) functions with two helper functions, and a main() function
 class RunMVC:
+
+    # The shared best MVC solution of the portfolio run this process is a worker of (None outside of portfolio runs)
+    incumbent = None
+    # The shared queue of subproblems of the BnB workers of a portfolio run (None outside of parallel BnB runs)
+    stealing = None
+    # The instrumentation of the run (a SolverStats, None when it is turned off)
+    stats = None
+    # The vertex cover the solvers start from (e.g. the stored cover of the graph, see SolutionStore), None for a cold start
+    warm_start = None
+    # The function every improved solution (time, VC value) of a solver is passed to as soon as it is found (None if nobody listens)
+    trace_callback = None
+
+    # This helper function returns the empty list a solver logs its improved solutions in (a TraceLog if trace_callback is set)
+    def new_trace(self):
+        if self.trace_callback is None:
+            return []
+        return TraceLog(self.trace_callback)
     
-    # This function is to parse vertices and edges in graph data structure using python library networkx
+    # This function is to parse vertices and edges into a CSRGraph by streaming the graph file line by line
     def parse_graph(self, filename):
-        # Initialize G with Graph() data structure in networkx 
-        G = nx.Graph()
-
         # Read graph file
-        f = open(filename)
-        content = f.readlines()
-        
-        # Read first line in graph file and record vertex count and edge count
-        first_line = content[0].split()
-        num_ver = int(first_line[0])
-        num_edg = int(first_line[1])
-        
-        # Read adjacency list line by line for each vertex
-        for i in range(1, num_ver + 1):
-            # Add node i in G
-            G.add_node(i)
-            
-            # Add each edge associated with vertex i
-            try:
-                eachline = content[i].strip().split()
-                edges = [int(nd) for nd in eachline]
-                for e in edges:
-                    G.add_edge(i, e)
-            except ValueError:
-                pass
-        return G
+        with open(filename) as f:
+            # Read first line in graph file and record vertex count
+            first_line = f.readline().split()
+            num_ver = int(first_line[0])
+
+            # Initialize the offsets array (index 0 is unused since vertex IDs start from 1) and the adjacency array
+            offsets = array('q', [0, 0])
+            adjacency = array('i')
+
+            # Read adjacency list line by line for each vertex
+            for i in range(1, num_ver + 1):
+                # Append the neighbors of vertex i to the adjacency array (a malformed line leaves vertex i isolated)
+                try:
+                    adjacency.extend(array('i', map(int, f.readline().split())))
+                except ValueError:
+                    pass
+                # Record where the neighbors of vertex i end
+                offsets.append(len(adjacency))
+
+        # Every edge is listed in the adjacency lists of both of its end points
+        return CSRGraph(num_ver, len(adjacency) // 2, offsets, adjacency)
+
+    # This function loads a graph through its binary cache (filename + ".bin"): the cache is memory-mapped when it matches
+    # the size and mtime of the source file, otherwise the source is parsed and the cache is (re)built for later runs
+    def load_graph(self, filename, use_cache=True):
+        # Parse the source file directly if caching is turned off
+        if not use_cache:
+            return self.parse_graph(filename)
+
+        cache_file = filename + ".bin"
+        src_stat = os.stat(filename)
+
+        # Memory-map the cache if it was built from the current version of the source file
+        try:
+            if CSRGraph.cache_source_stat(cache_file) == (src_stat.st_size, src_stat.st_mtime_ns):
+                return CSRGraph.from_cache(cache_file)
+        except (OSError, ValueError, struct.error):
+            pass
+
+        # Otherwise parse the source file and (re)build the cache, which is skipped if the directory is not writable
+        G = self.parse_graph(filename)
+        try:
+            G.to_cache(cache_file, src_stat.st_size, src_stat.st_mtime_ns)
+            return CSRGraph.from_cache(cache_file)
+        except OSError:
+            return G
     
+    # This function applies data reductions to G until none of them applies any more, and returns the reduced graph (kernel)
+    # with a lifting log that maps any vertex cover of the kernel back to a vertex cover of G (see lift_cover). The reductions are:
+    # - degree 0: an isolated vertex is never needed in the cover
+    # - degree 1: the neighbor of a degree-1 vertex is taken into the cover
+    # - degree 2: if the two neighbors a, b of v are adjacent both are taken, otherwise v, a, b are folded into one new vertex x
+    #             (x in the cover means a and b are in the cover, x not in the cover means v is in the cover)
+    # - dominance: if u is adjacent to v and N[v] is a subset of N[u], u is taken into the cover
+    # - LP (crown): vertices valued 1 in a half-integral optimum of the LP relaxation (computed from a maximum matching of the
+    #               bipartite double cover of G) are taken into the cover and vertices valued 0 are dropped (Nemhauser-Trotter)
+    def reduce_graph(self, G):
+        # Initialize the mutable remaining graph as adjacency sets (vertices created by folding get IDs after num_ver)
+        num_ver = G.number_of_nodes()
+        adj = [set()] + [set(G.neighbors(v)) for v in G.nodes()]
+        alive = [False] + [True] * num_ver
+        # Initialize the lifting log with an empty list: ('in', v) records that v is taken into the cover and
+        # ('fold', v, a, b, x) records that the degree-2 vertex v and its neighbors a, b were folded into x
+        log = []
+        # Initialize the stack of vertices whose degree changed and have to be checked against the degree rules
+        pending = list(range(num_ver, 0, -1))
+        queued = [False] + [True] * num_ver
+
+        # This helper function removes vertex v from the remaining graph and queues its neighbors for another check
+        def remove(v):
+            alive[v] = False
+            for u in adj[v]:
+                adj[u].discard(v)
+                if not queued[u]:
+                    queued[u] = True
+                    pending.append(u)
+            adj[v] = set()
+
+        # This helper function takes vertex v into the cover
+        def take(v):
+            log.append(('in', v))
+            remove(v)
+
+        # This helper function folds the degree-2 vertex v and its non-adjacent neighbors a, b into a new vertex x
+        def fold(v, a, b):
+            x = len(adj)
+            adj.append((adj[a] | adj[b]) - {v})
+            alive.append(True)
+            queued.append(True)
+            pending.append(x)
+            log.append(('fold', v, a, b, x))
+            for u in (v, a, b):
+                alive[u] = False
+                for y in adj[u]:
+                    adj[y].discard(u)
+                adj[u] = set()
+            for y in adj[x]:
+                adj[y].add(x)
+                if not queued[y]:
+                    queued[y] = True
+                    pending.append(y)
+
+        # This helper function applies the degree-0, degree-1 and degree-2 rules until no queued vertex is left
+        def degree_rules():
+            while pending:
+                v = pending.pop()
+                queued[v] = False
+                if not alive[v]:
+                    continue
+                if len(adj[v]) == 0:
+                    alive[v] = False
+                elif len(adj[v]) == 1:
+                    u = next(iter(adj[v]))
+                    take(u)
+                    remove(v)
+                elif len(adj[v]) == 2:
+                    a, b = adj[v]
+                    if b in adj[a]:
+                        take(a)
+                        take(b)
+                        remove(v)
+                    else:
+                        fold(v, a, b)
+
+        # This helper function applies the dominance rule to every remaining vertex and returns whether the graph changed
+        def dominance_rule():
+            changed = False
+            for v in range(1, len(adj)):
+                if not alive[v]:
+                    continue
+                for u in adj[v]:
+                    if len(adj[u]) >= len(adj[v]) and all(y == u or y in adj[u] for y in adj[v]):
+                        take(u)
+                        changed = True
+                        break
+            return changed
+
+        # This helper function applies the LP (crown) reduction and returns whether the graph changed
+        def lp_rule():
+            V = [v for v in range(1, len(adj)) if alive[v]]
+            inL, inR = self.lp_half_integral(V, adj)
+            # Take every vertex with LP value 1 and drop every vertex with LP value 0 (all of its neighbors have value 1)
+            ones = [v for v in V if inL[v] and inR[v]]
+            zeros = [v for v in V if not inL[v] and not inR[v]]
+            for v in ones:
+                take(v)
+            for v in zeros:
+                remove(v)
+            return len(ones) + len(zeros) > 0
+
+        # Apply the cheap degree rules exhaustively before each pass of the more expensive rules
+        while True:
+            degree_rules()
+            if dominance_rule():
+                continue
+            if lp_rule():
+                continue
+            break
+
+        # Relabel the remaining vertices as 1..k (kernel_map[i] is the vertex behind kernel vertex i) and build the kernel
+        kernel_map = [0] + [v for v in range(1, len(adj)) if alive[v]]
+        kernel_id = dict((v, i) for i, v in enumerate(kernel_map))
+        kernel = CSRGraph.from_adjacency([[]] + [sorted(kernel_id[u] for u in adj[v]) for v in kernel_map[1:]])
+        return kernel, (kernel_map, log)
+
+    # This helper function returns a half-integral optimum of the LP relaxation of MVC on the remaining vertices V (adjacency sets adj),
+    # as two flags per vertex: inL[v] + inR[v] is twice the LP value of v. It reads a minimum vertex cover of the bipartite double cover
+    # off a maximum matching (Konig's theorem)
+    def lp_half_integral(self, V, adj):
+        mateL, mateR = self.max_bipartite_matching(V, adj)
+
+        # Collect the vertices reachable from the unmatched left copies by alternating paths (Z)
+        reachL = dict((v, mateL[v] == 0) for v in V)
+        reachR = dict((v, False) for v in V)
+        frontier = [v for v in V if mateL[v] == 0]
+        for v in frontier:
+            for w in adj[v]:
+                if not reachR[w]:
+                    reachR[w] = True
+                    x = mateR[w]
+                    if x != 0 and not reachL[x]:
+                        reachL[x] = True
+                        frontier.append(x)
+
+        # The minimum vertex cover of the double cover is (left copies not in Z) + (right copies in Z)
+        inL = dict((v, not reachL[v]) for v in V)
+        return inL, reachR
+
+    # This helper function computes a maximum matching of the bipartite double cover of the vertices V (left copy of v adjacent to the
+    # right copies of adj[v]) with Hopcroft-Karp, and returns the partner of each left copy (mateL) and of each right copy (mateR), 0 if unmatched
+    def max_bipartite_matching(self, V, adj):
+        mateL = dict((v, 0) for v in V)
+        mateR = dict((v, 0) for v in V)
+        INF = len(V) + 1
+
+        while True:
+            # Build the BFS layers of alternating paths starting from the unmatched left copies
+            dist = dict((v, 0 if mateL[v] == 0 else INF) for v in V)
+            layer = [v for v in V if mateL[v] == 0]
+            found = False
+            for v in layer:
+                for w in adj[v]:
+                    x = mateR[w]
+                    if x == 0:
+                        found = True
+                    elif dist[x] == INF:
+                        dist[x] = dist[v] + 1
+                        layer.append(x)
+            if not found:
+                break
+
+            # Augment along vertex-disjoint shortest alternating paths with an iterative depth-first search
+            for root in V:
+                if mateL[root] != 0:
+                    continue
+                stack = [root]
+                via = []
+                iters = [iter(adj[root])]
+                while stack:
+                    v = stack[-1]
+                    advanced = False
+                    for w in iters[-1]:
+                        x = mateR[w]
+                        if x == 0:
+                            # Flip the matching along the path: stack[i] is matched to via[i] and the top of the stack to w
+                            via.append(w)
+                            for i in range(len(stack)):
+                                mateL[stack[i]] = via[i]
+                                mateR[via[i]] = stack[i]
+                            stack = []
+                            advanced = True
+                            break
+                        if dist[x] == dist[v] + 1:
+                            via.append(w)
+                            stack.append(x)
+                            iters.append(iter(adj[x]))
+                            advanced = True
+                            break
+                    if not advanced:
+                        # A dead end: remove v from the layered graph and backtrack
+                        dist[v] = INF
+                        stack.pop()
+                        iters.pop()
+                        if via:
+                            via.pop()
+
+        return mateL, mateR
+
+    # This function maps a vertex cover of the kernel returned by reduce_graph back to a vertex cover of the original graph
+    def lift_cover(self, kernel_cover, lifting):
+        kernel_map, log = lifting
+        # Translate the kernel vertices and add every vertex the reductions took into the cover
+        cover = set(kernel_map[v] for v in kernel_cover)
+        for entry in log:
+            if entry[0] == 'in':
+                cover.add(entry[1])
+        # Undo the folds from the last to the first, since a later fold may have consumed the vertex of an earlier one
+        for entry in reversed(log):
+            if entry[0] == 'fold':
+                v, a, b, x = entry[1:]
+                if x in cover:
+                    cover.discard(x)
+                    cover.add(a)
+                    cover.add(b)
+                else:
+                    cover.add(v)
+        return sorted(cover)
+
     # This function implements branch and bound (BnB) method to generate optimal MVC solution
-    def branch_and_bound(self, G, cutoff_time):
+    # The search is a depth-first search over one shared remaining graph: every branch removes vertices in place and
+    # records the changes on an undo trail, which is replayed backwards when the search backtracks out of the branch
+    # (bound names the lower bound providers to use, their largest bound is used for pruning)
+    def branch_and_bound(self, G, cutoff_time, bound="matching"):
         # Start timing
         start = time.time()
 
         # Initialize the improved solutions (improved_solution) with an empty list
-        improved_solution = []
+        improved_solution = self.new_trace()
         # Add the time log and the associated inital best solution (VC value) as a pair in the improved solutions
-        improved_solution.append((time.time() - start, len(list(G.nodes))))
+        improved_solution.append((time.time() - start, G.number_of_nodes()))
         # Initialize the best solution (VC) with the return value (a set) from the helper function of min_weighted_vertex_cover(G, None)
         VC = self.min_weighted_vertex_cover(G, None)
+        # Start from the warm start cover instead if it is smaller
+        if self.warm_start is not None and len(self.warm_start) < len(VC):
+            VC = list(self.warm_start)
         # Initialize the upper bound as the size of initial solution (VC)
         upperbound = len(VC)
         # Add the time log and the associated inital upper bound constrained best solution if it is improved
-        if upperbound < len(list(G.nodes)):
+        if upperbound < G.number_of_nodes():
         	improved_solution.append((time.time() - start, len(VC)))
-        
-        # Sort the vertices by its degree in ascending order and store as pairs of (vertex, vertex's degree) in a list (degree_sorted)
-        degree_sorted = sorted(G.degree(),key=lambda x: x[1]) 
-
-        # Initialize a stack data structure (q) with queue.LifoQueue()
-        q = queue.LifoQueue()
-        # Initialize current vertex cover (I) with an empty list
-        I = []
-        # Initialize the remaining vertices (V_remaining) with an empty list
-        V_remaining = []
-        # Add each vertex in the remaining vertices by the ascending order of degree
-        for nd in degree_sorted:
-            V_remaining.append(nd)
-        # Initilaze the remaining graph (G_remaining) with a deep copy of original graph (G)
-        G_remaining = dc(G)
-        # Put a pair (current vertex cover (I), remaining vertices (V_remaining), remaining graph (G_remaining)) into stack q
-        q.put((I,V_remaining, G_remaining))
-        
-        # Record the time duration (runtime) before the following while loop
-        runtime = time.time() - start
-        
-        # Iteratively pop subproblem out of stack while runtime not exceeding cutoff time threshold
-        while(not q.empty() and runtime < cutoff_time): # still worth searching
-            # Stack pop pair (current vertex cover, remaining vertices, remaining graph)
-            Inc,V_rem,G_rem = q.get()
-            
-            # Update the lowerbound with the current vertex cover and the remaining graph using the helper fucntion (maximal_matching) in networkx 
-            lowerbound = len(Inc) + len(nx.maximal_matching(G_rem)) # set LB = (current VC) + (max_matching of Graph_Remain)
-            
-            # A new MVC solution is generated when all the edges are covered
-            if len(G_rem.edges())==0: #if no more edges left, this branch is over
-                # Update the best MVC solution (VC) and corresponding upper bound if the solution is improved
-                if len(Inc) < upperbound:
-                    # Update the upper bound
-                    upperbound = len(Inc)
-                    # Record the time log and the associated improved VC value
-                    improved_solution.append((time.time() - start, len(Inc)))
-                    # Update the the best MVC solution
-                    VC = Inc
-            # The solution hasn't been generated yet, keep exploring the subproblems
+
+        # Retrieve the CSR arrays of G
+        offsets = G.offsets
+        adjacency = G.adjacency
+        num_ver = G.number_of_nodes()
+
+        # Initialize the remaining graph state: removed-vertex flags, current degrees and the remaining edge count
+        removed = bytearray(num_ver + 1)
+        deg = [0] + [offsets[v + 1] - offsets[v] for v in range(1, num_ver + 1)]
+        rem_edges = [G.number_of_edges()]
+        # Initialize the degree buckets of the remaining vertices (bucket[d] holds the remaining vertices of current degree d,
+        # where[v] is the position of v in its bucket) and the highest current degree (top)
+        top = [max(deg)]
+        bucket = [[] for d in range(top[0] + 1)]
+        where = [0] * (num_ver + 1)
+        for v in range(1, num_ver + 1):
+            where[v] = len(bucket[deg[v]])
+            bucket[deg[v]].append(v)
+
+        # This helper function takes vertex v out of its degree bucket (the last vertex of the bucket fills its position)
+        def bucket_remove(v):
+            b = bucket[deg[v]]
+            last = b.pop()
+            if last != v:
+                b[where[v]] = last
+                where[last] = where[v]
+
+        # This helper function puts vertex v into the bucket of its current degree
+        def bucket_add(v):
+            where[v] = len(bucket[deg[v]])
+            bucket[deg[v]].append(v)
+
+        # Initialize the selected lower bound providers on the remaining graph state
+        providers = [BOUND_PROVIDERS[name](G, removed, deg, rem_edges) for name in bound.split(",")]
+
+        # Initialize the undo trail with an empty list: (None, v) records the removal of v and (provider, data) records a change
+        # of a lower bound provider, which is reverted by provider.undo(data)
+        trail = []
+
+        # This helper function removes vertex v from the remaining graph and lets every lower bound provider update itself
+        def remove_vertex(v):
+            removed[v] = 1
+            rem_edges[0] -= deg[v]
+            bucket_remove(v)
+            for i in range(offsets[v], offsets[v + 1]):
+                u = adjacency[i]
+                if not removed[u]:
+                    bucket_remove(u)
+                    deg[u] -= 1
+                    bucket_add(u)
+            trail.append((None, v))
+            for provider in providers:
+                provider.remove(v, trail)
+
+        # This helper function replays the undo trail backwards until it is back to length mark
+        def undo(mark):
+            while len(trail) > mark:
+                provider, data = trail.pop()
+                if provider is None:
+                    removed[data] = 0
+                    rem_edges[0] += deg[data]
+                    bucket_add(data)
+                    top[0] = max(top[0], deg[data])
+                    for i in range(offsets[data], offsets[data + 1]):
+                        u = adjacency[i]
+                        if not removed[u]:
+                            bucket_remove(u)
+                            deg[u] += 1
+                            bucket_add(u)
+                            top[0] = max(top[0], deg[u])
+                else:
+                    provider.undo(data)
+
+        # Initialize current vertex cover (Inc) with an empty list
+        Inc = []
+        # Initialize the stack of open branches with an empty list, each entry is [branching vertex, branch number, trail length, cover length]
+        stack = []
+        # Initialize a flag telling whether the current subproblem still has to be evaluated (True) or the search has to backtrack (False)
+        # (a worker of a parallel BnB run starts without a subproblem and takes its first one from the shared queue)
+        descend = self.stealing is None
+
+        # Retrieve the shared size of the best MVC solution of a portfolio run, which is read at every node without taking its lock
+        shared_size = self.incumbent.size.get_obj() if self.incumbent is not None else None
+        # Initialize the counters of the search: loop iterations (steps), evaluated subproblems (nodes), lower bound computations (bounds),
+        # pruned subproblems (prunes), vertex covers reached (covers), subproblems donated to and taken from other workers, and clock reads
+        steps = nodes = bounds = prunes = covers = donated = taken = clock_checks = 0
+
+        # This helper function donates the open branch at the bottom of the stack to the shared queue of a parallel BnB run: the removed
+        # vertices are those removed before the branch plus the remaining neighbors of its branching vertex, which join the partial cover
+        def donate():
+            for frame in stack:
+                if frame[1] == 0:
+                    break
             else:
-                # Retrieve the vertex with the highest degree (v) from the remaining vertice list (if not empty)
-                if len(V_rem)!=0:   
-                    v, v_degree = V_rem.pop()
-                
-                # Expand the subproblems if the lowerbound is no more than the upper bound (valid)
-                if lowerbound <= upperbound:
-                    # One subproblem: add all neighbors of v to the current vertex cover
-                    V_I = Inc
-                    # Add all neighbors of v in the remaining graph into the vertex cover 2 (frontier set, V_I)
-                    V_I = V_I + list(G_rem.neighbors(v))
-                    # Remove all neighbors of v from the remaining vertice list (V_R)
-                    V_R = V_rem
-                    V_R = list(filter(lambda a: a[0] not in G_rem.neighbors(v), V_R))  # exclude v.neighbor
-                    # Remove all neighbors of v from the remaining graph (G_nextrem)
-                    G_nextrem = dc(G_rem)
-                    G_nextrem.remove_nodes_from(list(G_rem.neighbors(v))) 
-                    # put this subproblem into stack
-                    q.put((dc(V_I), dc(V_R), dc(G_nextrem)))
-                    
-                    # Another subproblem: add v to the current vertex cover
-                    # Remove v from the remaining graph (G_rem)
-                    G_rem.remove_node(v)
-                    # Add v into the vertex cover (frontier set, Inc)
+                return
+            removed_before = bytearray(num_ver + 1)
+            for k in range(frame[2]):
+                if trail[k][0] is None:
+                    removed_before[trail[k][1]] = 1
+            cover = array('i', Inc[:frame[3]])
+            v = frame[0]
+            for i in range(offsets[v], offsets[v + 1]):
+                if not removed_before[adjacency[i]]:
+                    removed_before[adjacency[i]] = 1
+                    cover.append(adjacency[i])
+            bits = bytearray((num_ver >> 3) + 1)
+            for u in range(1, num_ver + 1):
+                if removed_before[u]:
+                    bits[u >> 3] |= 1 << (u & 7)
+            self.stealing.donate(bytes(bits), cover.tobytes())
+            # The donated branch is no longer explored here
+            frame[1] = 1
+            return True
+
+        # Record the time duration (runtime) before the following while loop and when the best MVC solution is next exchanged with the other
+        # workers of a portfolio run (next_sync): a better solution found by another worker becomes the upper bound
+        runtime = time.time() - start
+        next_sync = 0
+
+        # Iteratively evaluate subproblems while runtime not exceeding cutoff time threshold
+        while runtime < cutoff_time:
+            if self.incumbent is not None:
+                if runtime >= next_sync:
+                    next_sync = runtime + SYNC_INTERVAL
+                    shared = self.sync_incumbent(upperbound, VC)
+                    if shared is not None:
+                        upperbound, VC = shared
+                # Prune with a better solution of another worker as soon as it is published
+                if shared_size.value < upperbound:
+                    upperbound = shared_size.value
+            if descend:
+                nodes += 1
+                # Compute the lowerbound of the subproblem (current VC + largest lower bound of the remaining graph)
+                bounds += 1
+                lowerbound = len(Inc) + max(provider.bound() for provider in providers)
+                # A new MVC solution is generated when all the edges are covered
+                if rem_edges[0] == 0:
+                    covers += 1
+                    # Update the best MVC solution (VC) and corresponding upper bound if the solution is improved
+                    if len(Inc) < upperbound:
+                        # Update the upper bound
+                        upperbound = len(Inc)
+                        # Record the time log and the associated improved VC value
+                        improved_solution.append((time.time() - start, len(Inc)))
+                        # Update the the best MVC solution
+                        VC = list(Inc)
+                        # Broadcast the improved solution to the other workers of a portfolio run
+                        if self.incumbent is not None:
+                            self.incumbent.publish(upperbound, VC)
+                    descend = False
+                # Prune the subproblem if its lowerbound cannot beat the upper bound
+                elif lowerbound >= upperbound:
+                    prunes += 1
+                    descend = False
+                # Otherwise let the providers that can tighten their bound on the remaining graph try again when the bound is close
+                elif lowerbound >= upperbound - TIGHTEN_GAP and \
+                        len(Inc) + max(provider.tighten(trail) if hasattr(provider, "tighten") else provider.bound() for provider in providers) >= upperbound:
+                    prunes += 1
+                    descend = False
+                # A vertex v of degree 1 needs no branching: adding its only neighbor to the current vertex cover is never worse than adding v
+                elif bucket[1]:
+                    v = bucket[1][-1]
+                    # Only the subproblem that adds all neighbors of v is opened (its branch number is already 1)
+                    stack.append([v, 1, len(trail), len(Inc)])
+                    for i in range(offsets[v], offsets[v + 1]):
+                        u = adjacency[i]
+                        if not removed[u]:
+                            remove_vertex(u)
+                            Inc.append(u)
+                else:
+                    # Retrieve the remaining vertex with the highest current degree (v)
+                    while not bucket[top[0]]:
+                        top[0] -= 1
+                    v = bucket[top[0]][-1]
+                    # One subproblem: add v to the current vertex cover (explored first)
+                    stack.append([v, 0, len(trail), len(Inc)])
+                    remove_vertex(v)
                     Inc.append(v)
-                    # put this subproblem into stack
-                    q.put((dc(Inc), dc(V_rem), dc(G_rem)))
-            
-            # Record the corrent run time in the end of each iteration in while loop
-            runtime = time.time() - start
-        
+            else:
+                # Backtrack: stop if there is no open branch left, unless this is a worker of a parallel BnB run, which then restores the
+                # input graph and continues with a subproblem taken from the shared queue (until the whole search tree has been explored)
+                if not stack:
+                    if self.stealing is None:
+                        break
+                    subproblem = self.stealing.take(start + cutoff_time)
+                    if subproblem is None:
+                        break
+                    undo(0)
+                    removed_bits, cover = subproblem
+                    for v in range(1, num_ver + 1):
+                        if removed_bits[v >> 3] >> (v & 7) & 1:
+                            remove_vertex(v)
+                    Inc = array('i')
+                    Inc.frombytes(cover)
+                    Inc = Inc.tolist()
+                    taken += 1
+                    descend = True
+                    runtime = time.time() - start
+                    continue
+                frame = stack[-1]
+                # Revert the remaining graph and the current vertex cover to the state before the branch
+                undo(frame[2])
+                del Inc[frame[3]:]
+                if frame[1] == 0:
+                    # Another subproblem: add all neighbors of v in the remaining graph to the current vertex cover
+                    frame[1] = 1
+                    v = frame[0]
+                    for i in range(offsets[v], offsets[v + 1]):
+                        u = adjacency[i]
+                        if not removed[u]:
+                            remove_vertex(u)
+                            Inc.append(u)
+                    descend = True
+                else:
+                    # Both subproblems of v have been explored
+                    stack.pop()
+
+            # Record the corrent run time every CLOCK_CHECK_INTERVAL iterations of the while loop, report the counters, and give the bottom
+            # open branch to an idle worker of a parallel BnB run
+            steps += 1
+            if steps % CLOCK_CHECK_INTERVAL == 0:
+                runtime = time.time() - start
+                clock_checks += 1
+                if self.stealing is not None and self.stealing.hungry() and donate():
+                    donated += 1
+                if self.stats is not None:
+                    self.stats.count("BnB", nodes=nodes, bounds=bounds, prunes=prunes, covers=covers, donated=donated, taken=taken, clock_checks=clock_checks)
+
+        # Report the final counters
+        if self.stats is not None:
+            self.stats.count("BnB", nodes=nodes, bounds=bounds, prunes=prunes, covers=covers, donated=donated, taken=taken, clock_checks=clock_checks)
+
         # Return best VC value, best MVC solution, and improved solutions
         return len(VC), VC, improved_solution
     
     # This helper function return the 2-approximate vertex cover as the upperbound for the MVC solution
     def min_weighted_vertex_cover(self, G, weight=None):
-        # Define a weight function for vertices (default weight is 1)
-        weight_func = lambda nd: nd.get(weight, 1)
-        
-        # Define a cost dictionary with vertex ID as the key and its weight (calculated by weight_func) as the value
-        cost = dict((n, weight_func(nd)) for n, nd in G.nodes(data=True))
+        # Define a cost dictionary with vertex ID as the key and its weight as the value (the CSRGraph carries no vertex data, so every weight is 1)
+        cost = dict((n, 1) for n in G.nodes())
         
         # Iterate each edge in the edge set of grpah G
         for u,v in G.edges():
@@ -150,84 +1334,203 @@ class RunMVC:
         return set(u for u in cost if cost[u] == 0)
     
     # This function implements heuristic approximation (Approx) method to generate near-optimal MVC solution (OPT <= sol <= 2OPT)
+    # Picking a random uncovered edge again and again is the same as scanning the edges once in a random order and taking both end points
+    # of every edge that is still uncovered, which runs in O(V + E)
     def heuristic_approximation(self, G, cutoff_time, random_seed):
         # Start timing
         start = time.time()
 
-        # Initialize the current MVC solution (vertex_cover) with an empty list
+        # Initialize the current MVC solution (vertex_cover) with an empty list and the in-cover flags (covered) of all the vertices
         vertex_cover = []
+        covered = bytearray(G.number_of_nodes() + 1)
         # Initialize the improved solutions (improved_solution) with an empty list
-        improved_solution = []
-        # Initialize the uncovered edges list (uncovered_edges) with all the edges of the graph G
-        uncovered_edges = list(G.edges())
+        improved_solution = self.new_trace()
+        # Initialize the edge list (edges) with all the edges of the graph G
+        edges = list(G.edges())
         
-        # Initialize random seed with the input seed
+        # Initialize random seed with the input seed and put the edges in a random order
         random.seed(random_seed)
+        random.shuffle(edges)
 
-        # Record the time duration (runtime) before the following while loop
+        # Record the time duration (runtime) before the following for loop and initialize the counters of scanned edges and clock reads
         runtime = time.time() - start
+        scanned = clock_checks = 0
 
-        # Iterate until the uncovered edge list is empty or the runtime exceeding the cutoff time threshold
-        while uncovered_edges != [] and runtime < cutoff_time:
-            # Randomly select an edge within the uncovered edge list and assign its two end points to u and v, respectively
-            u, v = random.choice(uncovered_edges)
-            # Add the two end points of the randomly selected edge (u and v) into the vertex cover list
-            vertex_cover.append(u)
-            vertex_cover.append(v)
-            # Remove all the edges that have either u or v as one of the end points from the uncovered edge list
-            uncovered_edges = list(filter(lambda a: a[0] != u and a[0] != v and a[1] != u and a[1] != v, uncovered_edges))
+        # Scan the edges in the random order until the runtime exceeding the cutoff time threshold (the clock is read every CLOCK_CHECK_INTERVAL edges)
+        for i in range(len(edges)):
+            scanned += 1
+            u, v = edges[i]
+            # Add the two end points of an uncovered edge (u and v) into the vertex cover list
+            if not covered[u] and not covered[v]:
+                covered[u] = 1
+                covered[v] = 1
+                vertex_cover.append(u)
+                vertex_cover.append(v)
             
-            # Record the corrent run time in the end of each iteration in while loop
-            runtime = time.time() - start
+            # Record the corrent run time every CLOCK_CHECK_INTERVAL edges
+            if i % CLOCK_CHECK_INTERVAL == 0:
+                runtime = time.time() - start
+                clock_checks += 1
+                if runtime >= cutoff_time:
+                    break
         
-        # Record the time log and the associated improved VC value (only one pair since the valid solution is only generated after the while loop)
+        # Record the time log and the associated improved VC value (only one pair since the valid solution is only generated after the for loop)
         improved_solution.append((time.time() - start, len(vertex_cover)))
+
+        # Report the counters
+        if self.stats is not None:
+            self.stats.count("Approx", edges_scanned=scanned, clock_checks=clock_checks)
         
         # Return best VC value, best MVC solution, and improved solutions
         return len(vertex_cover), vertex_cover, improved_solution
 
+    # This function implements the greedy max-degree variant of heuristic approximation (ApproxGreedy): it repeatedly adds the vertex of highest
+    # remaining degree to the vertex cover (ties broken in a random order), keeping the vertices in a bucket queue by remaining degree so that
+    # the whole run is O(V + E); it has no constant approximation guarantee but is usually much closer to OPT than the edge-based Approx
+    def greedy_approximation(self, G, cutoff_time, random_seed):
+        # Start timing
+        start = time.time()
+
+        # Retrieve the CSR arrays of G
+        offsets = G.offsets
+        adjacency = G.adjacency
+        num_ver = G.number_of_nodes()
+
+        # Initialize random seed with the input seed and put the vertices in a random order (the order ties are broken in)
+        random.seed(random_seed)
+        order = list(range(1, num_ver + 1))
+        random.shuffle(order)
+
+        # Initialize the remaining degrees (deg) and the bucket queue (bucket[d] holds the vertices of remaining degree d,
+        # where[v] is the position of v in its bucket) with the highest remaining degree (top)
+        deg = [0] + [offsets[v + 1] - offsets[v] for v in range(1, num_ver + 1)]
+        top = max(deg)
+        bucket = [[] for d in range(top + 1)]
+        where = [0] * (num_ver + 1)
+        for v in order:
+            where[v] = len(bucket[deg[v]])
+            bucket[deg[v]].append(v)
+
+        # This helper function takes vertex v out of its bucket (the last vertex of the bucket fills its position)
+        def bucket_remove(v):
+            b = bucket[deg[v]]
+            last = b.pop()
+            if last != v:
+                b[where[v]] = last
+                where[last] = where[v]
+
+        # Initialize the current MVC solution (vertex_cover) with an empty list and the in-cover flags (covered) of all the vertices
+        vertex_cover = []
+        covered = bytearray(num_ver + 1)
+        # Initialize the improved solutions (improved_solution) with an empty list
+        improved_solution = self.new_trace()
+
+        # Record the time duration (runtime) before the following while loop and initialize the counter of clock reads
+        runtime = time.time() - start
+        clock_checks = 0
+
+        # Iterate until no vertex has remaining edges or the runtime exceeding the cutoff time threshold (the clock is read every CLOCK_CHECK_INTERVAL vertices)
+        while runtime < cutoff_time:
+            # Retrieve the vertex with the highest remaining degree (v)
+            while top > 0 and not bucket[top]:
+                top -= 1
+            if top == 0:
+                break
+            v = bucket[top][-1]
+            # Add v into the vertex cover list and lower the remaining degrees of its uncovered neighbors
+            bucket_remove(v)
+            covered[v] = 1
+            vertex_cover.append(v)
+            for i in range(offsets[v], offsets[v + 1]):
+                u = adjacency[i]
+                if not covered[u]:
+                    bucket_remove(u)
+                    deg[u] -= 1
+                    where[u] = len(bucket[deg[u]])
+                    bucket[deg[u]].append(u)
+
+            # Record the corrent run time every CLOCK_CHECK_INTERVAL vertices
+            if len(vertex_cover) % CLOCK_CHECK_INTERVAL == 0:
+                runtime = time.time() - start
+                clock_checks += 1
+
+        # Record the time log and the associated improved VC value (only one pair since the valid solution is only generated after the while loop)
+        improved_solution.append((time.time() - start, len(vertex_cover)))
+
+        # Report the counters
+        if self.stats is not None:
+            self.stats.count("ApproxGreedy", vertices_picked=len(vertex_cover), clock_checks=clock_checks)
+
+        # Return best VC value, best MVC solution, and improved solutions
+        return len(vertex_cover), vertex_cover, improved_solution
+
     # This function implements hill climbing (LS1, HC) method to generate near-optimal MVC solution
     def hill_climbing(self, G, cutoff_time, random_seed):
         # Start timing
         start = time.time()
 
-        # Initialize the current MVC solution (vertex_cover) with all the vertices of G
-        vertex_cover = list(G.nodes)
+        # Initialize the current MVC solution (vertex_cover) with all the vertices of G, or the warm start cover (a set, so membership checks and removals are O(1))
+        vertex_cover = set(G.nodes()) if self.warm_start is None else set(self.warm_start)
         # Initialize the improved solutions (improved_solution) with an empty list
-        improved_solution = []
+        improved_solution = self.new_trace()
         # Add the time log and the associated inital MVC solution as a pair in the improved solutions
         improved_solution.append((time.time() - start, len(vertex_cover)))
-        # Initialize best VC value (best_vc_size) with the count of all vertices of G
-        best_vc_size = len(G.nodes)
+        # Initialize best VC value (best_vc_size) with the size of the current MVC solution and the best MVC solution (best_vc) with the current one
+        # (hill climbing only ever removes vertices, so the current MVC solution is always the best one)
+        best_vc_size = len(vertex_cover)
+        best_vc = vertex_cover
 
         # Sort the vertices by its degree in ascending order and store as pairs of (vertex, vertex's degree) in a list (degree_sorted)
-        degree_sorted = sorted(G.degree(), key=lambda x: x[1])
+        degree_sorted = sorted(G.degrees(), key=lambda x: x[1])
+        # Position of the first vertex of degree_sorted that has not been tried yet
+        next_pos = 0
         
         # Initialize random seed with the input seed
         random.seed(random_seed)
 
-        # Record the time duration (runtime) before the following while loop
+        # Record the time duration (runtime) before the following while loop and when the best MVC solution is next exchanged with the other
+        # workers of a portfolio run (next_sync): the search continues from a better solution found by another worker
         runtime = time.time() - start
+        next_sync = 0
+        # Initialize the counters of tried and accepted removals, validity checks, restarts from another worker's solution, and clock reads
+        tried = accepted = checks = restarts = clock_checks = 0
         
-        # Iterate until the vertice list (sorted by degree) is empty or the runtime exceeding the cutoff time threshold
-        while degree_sorted != [] and runtime < cutoff_time:
-            # Retrieve the vertices with the smallest degree and store them in a list (least_degree_vertices)
-            least_degree_vertices = list(filter(lambda a: a[1] == degree_sorted[0][1], degree_sorted))
+        # Iterate until every vertex of the vertice list (sorted by degree) has been tried or the runtime exceeding the cutoff time threshold
+        while next_pos < len(degree_sorted) and runtime < cutoff_time:
+            # Retrieve the untried vertices with the smallest degree and store them in a list (least_degree_vertices)
+            group_end = next_pos
+            while group_end < len(degree_sorted) and degree_sorted[group_end][1] == degree_sorted[next_pos][1]:
+                group_end += 1
+            least_degree_vertices = degree_sorted[next_pos:group_end]
+            next_pos = group_end
             
             # Iterate each vertex in the least degree vertice list while not exceeding the cutoff time
             while least_degree_vertices != [] and runtime < cutoff_time:
-                # Randomly select a vertex within the least degree vertice list
-                cur_vertex, cur_degree = random.choice(least_degree_vertices)
+                if self.incumbent is not None and runtime >= next_sync:
+                    next_sync = runtime + SYNC_INTERVAL
+                    shared = self.sync_incumbent(best_vc_size, best_vc)
+                    if shared is not None:
+                        best_vc_size = shared[0]
+                        vertex_cover = best_vc = set(shared[1])
+                        restarts += 1
+                # Randomly select a vertex within the least degree vertice list and take it out of the list (the last vertex fills its position)
+                i = random.randrange(len(least_degree_vertices))
+                cur_vertex, cur_degree = least_degree_vertices[i]
+                least_degree_vertices[i] = least_degree_vertices[-1]
+                least_degree_vertices.pop()
+                # Skip the vertex if it is not in the current vertex cover (after a warm start or a restart from another worker's solution)
+                if cur_vertex not in vertex_cover:
+                    continue
                 # Remove this randomly selected vertex from current vertex cover
                 vertex_cover.remove(cur_vertex)
+                tried += 1
+                checks += 1
                 # Check the validity of the updated vertex cover
                 if not self.check_valid_vc(vertex_cover, cur_vertex, G):
                     # Add this vertex back to the current vertex cover if the validity is broken
-                    vertex_cover.append(cur_vertex)
-                
-                # Remove this randomly selected vertex from the least_degree_vertices list and the degree_sorted list
-                least_degree_vertices.remove((cur_vertex, cur_degree))
-                degree_sorted.remove((cur_vertex, cur_degree))
+                    vertex_cover.add(cur_vertex)
+                else:
+                    accepted += 1
                 
                 # Update the best MVC solution (best_vc) and corresponding VC value (best_vc_size) if the solution is improved
                 if len(vertex_cover) < best_vc_size:
@@ -235,14 +1538,17 @@ class RunMVC:
                     improved_solution.append((time.time() - start, len(vertex_cover)))
                     # Update the best VC value
                     best_vc_size = len(vertex_cover)
-                    # Update the best MVC solution
-                    best_vc = vertex_cover
                 
-                # Record the corrent run time in the end of each iteration in inner while loop
-                runtime = time.time() - start
-            
-            # Record the corrent run time in the end of each iteration in outer while loop
-            runtime = time.time() - start
+                # Record the corrent run time every CLOCK_CHECK_INTERVAL tried vertices and report the counters
+                if tried % CLOCK_CHECK_INTERVAL == 0:
+                    runtime = time.time() - start
+                    clock_checks += 1
+                    if self.stats is not None:
+                        self.stats.count("LS1", moves_tried=tried, moves_accepted=accepted, validity_checks=checks, restarts=restarts, clock_checks=clock_checks)
+
+        # Report the final counters
+        if self.stats is not None:
+            self.stats.count("LS1", moves_tried=tried, moves_accepted=accepted, validity_checks=checks, restarts=restarts, clock_checks=clock_checks)
 
         # Return best VC value, best MVC solution, and improved solutions
         return best_vc_size, best_vc, improved_solution
@@ -252,16 +1558,19 @@ class RunMVC:
         # Start timing
         start = time.time()
         
-        # Initialize the current MVC solution (vertex_cover) with all the vertices of G
-        vertex_cover = list(G.nodes)
+        # Initialize the current MVC solution (vertex_cover) with all the vertices of G, or the warm start cover (a set, so membership checks and removals are O(1))
+        vertex_cover = set(G.nodes()) if self.warm_start is None else set(self.warm_start)
         # Initialize the improved solutions (improved_solution) with an empty list
-        improved_solution = []
+        improved_solution = self.new_trace()
         # Add the time log and the associated inital MVC solution as a pair in the improved solutions
         improved_solution.append((time.time() - start, len(vertex_cover)))
-        # Initialize best VC value (best_vc_size) with the count of all vertices of G
-        best_vc_size = len(G.nodes)
+        # Initialize best VC value (best_vc_size) with the size of the current MVC solution
+        best_vc_size = len(vertex_cover)
+        # Initialize the vertices added to or removed from the current MVC solution since the best one (changes) with an empty list,
+        # so the best MVC solution can be restored at the end without copying the current one at every improvement
+        changes = []
         # Get total edge count of G and assign it to edge_num
-        edge_num = len(G.edges)
+        edge_num = G.number_of_edges()
         
         # Initialize temperature (temp) as 100, end temperature (end_temp) as 1e-3, and folding scale ratio (decreasing_ratio) of 0.99999
         temp = 100
@@ -271,34 +1580,52 @@ class RunMVC:
         # Initialize random seed with the input seed
         random.seed(random_seed)
 
-        # Record the time duration (runtime) before the following while loop
+        # Record the time duration (runtime) before the following while loop and when the best MVC solution is next exchanged with the other
+        # workers of a portfolio run (next_sync): the best MVC solution is only published while it is the current one (no changes since),
+        # and the search restarts from a better solution found by another worker
         runtime = time.time() - start
+        next_sync = 0
+        # Initialize the counters of tried and accepted moves, validity checks, restarts from another worker's solution, and clock reads
+        tried = accepted = checks = restarts = clock_checks = 0
 
         # Iterate until the current temperature is no more larger than end temperature or the runtime exceeding the cutoff time threshold
         while temp > end_temp and runtime < cutoff_time:
+            if self.incumbent is not None and runtime >= next_sync:
+                next_sync = runtime + SYNC_INTERVAL
+                shared = self.sync_incumbent(best_vc_size, None if changes else vertex_cover)
+                if shared is not None:
+                    best_vc_size = shared[0]
+                    vertex_cover = set(shared[1])
+                    changes = []
+                    restarts += 1
+
             # Update the current temperature
             temp = temp * decreasing_ratio
             
             # Randomly pick a vertex (random_vertex) from the vertice set of G
-            random_vertex = random.choice(list(G.nodes)) 
+            random_vertex = random.choice(G.nodes()) 
+            tried += 1
             
             # If the randomly selected vertex is in current vertex cover
             if random_vertex in vertex_cover:
-                # Remove this randomly selected vertex from current vertex cover
+                # Remove this randomly selected vertex from current vertex cover if the updated vertex cover is still valid
                 vertex_cover.remove(random_vertex)
-                # Check the validity of the updated vertex cover
-                if not self.check_valid_vc(vertex_cover, random_vertex, G):
+                checks += 1
+                if self.check_valid_vc(vertex_cover, random_vertex, G):
+                    changes.append(random_vertex)
+                    accepted += 1
+                else:
                     # Add this vertex back to the current vertex cover if the validity is broken
-                    vertex_cover.append(random_vertex)
+                    vertex_cover.add(random_vertex)
             # If the randomly selected vertex is NOT in current vertex cover
             else:
-                # Add this vertex into the current vertex cover
-                vertex_cover.append(random_vertex)     
                 # Calculate the probability of this vertex to be kept in the current vertex cover
                 p = math.exp(-(1 - G.degree(random_vertex) / edge_num) / temp)
-                # If the calculated probability is smaller than the randomly generated value betweeon 0 and 1, remove this vertex from the current vertex cover
-                if p < random.uniform(0, 1):
-                    vertex_cover.remove(random_vertex)
+                # Add this vertex into the current vertex cover unless the calculated probability is smaller than the randomly generated value betweeon 0 and 1
+                if p >= random.uniform(0, 1):
+                    vertex_cover.add(random_vertex)
+                    changes.append(random_vertex)
+                    accepted += 1
             
             # Update the best MVC solution (best_vc) and corresponding VC value (best_vc_size) if the solution is improved
             if len(vertex_cover) < best_vc_size:
@@ -306,19 +1633,275 @@ class RunMVC:
                 improved_solution.append((time.time() - start, len(vertex_cover)))
                 # Update the best VC value
                 best_vc_size = len(vertex_cover)
-                # Update the best MVC solution
-                best_vc = vertex_cover
+                # The current MVC solution is the best one
+                changes = []
             
-            # Record the corrent run time in the end of each iteration in while loop
-            runtime = time.time() - start
+            # Record the corrent run time every CLOCK_CHECK_INTERVAL iterations of the while loop and report the counters
+            if tried % CLOCK_CHECK_INTERVAL == 0:
+                runtime = time.time() - start
+                clock_checks += 1
+                if self.stats is not None:
+                    self.stats.count("LS2", moves_tried=tried, moves_accepted=accepted, validity_checks=checks, restarts=restarts, clock_checks=clock_checks)
+
+        # Report the final counters
+        if self.stats is not None:
+            self.stats.count("LS2", moves_tried=tried, moves_accepted=accepted, validity_checks=checks, restarts=restarts, clock_checks=clock_checks)
+
+        # Restore the best MVC solution (best_vc) by reverting the changes made since it was found
+        for v in reversed(changes):
+            if v in vertex_cover:
+                vertex_cover.remove(v)
+            else:
+                vertex_cover.add(v)
+        best_vc = vertex_cover
 
         # Return best VC value, best MVC solution, and improved solutions
         return best_vc_size, best_vc, improved_solution           
 
+    # This function implements an edge-weighting local search (LS3, in the style of NuMVC/FastVC) to generate near-optimal MVC solution
+    # Every move costs O(deg): the cover is kept as in-cover flags plus an array of its vertices, every vertex has a score (dscore, the drop
+    # of the total weight of uncovered edges if the vertex is flipped), and the uncovered edges are kept in an indexed array. Whenever the
+    # current solution is a vertex cover, the vertex with the highest score is removed; otherwise the search swaps a cover vertex (best of
+    # REMOVE_SAMPLES random ones) for an end point of a random uncovered edge allowed by configuration checking, and raises the weights of
+    # the uncovered edges so that the search escapes plateaus
+    def weighted_local_search(self, G, cutoff_time, random_seed):
+        # Start timing
+        start = time.time()
+
+        # Initialize random seed with the input seed
+        random.seed(random_seed)
+
+        # Retrieve the CSR arrays of G and number the edges: slot i of the adjacency array holds edge edge_of[i], whose end points are (edge_u, edge_v)
+        offsets = G.offsets
+        adjacency = G.adjacency
+        num_ver = G.number_of_nodes()
+        edge_of = array('i', bytes(4 * len(adjacency)))
+        edge_u = array('i')
+        edge_v = array('i')
+        edge_ids = {}
+        for u in range(1, num_ver + 1):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = adjacency[i]
+                if u < v:
+                    edge_ids[(u, v)] = len(edge_u)
+                    edge_of[i] = len(edge_u)
+                    edge_u.append(u)
+                    edge_v.append(v)
+                else:
+                    edge_of[i] = edge_ids[(v, u)]
+        edge_ids = None
+        num_edg = len(edge_u)
+
+        # Initialize edge weights (weight), scores (dscore), configuration checking flags (conf_change) and the step each vertex last changed (age)
+        weight = [1] * num_edg
+        dscore = [0] * (num_ver + 1)
+        conf_change = bytearray(b'\x01' * (num_ver + 1))
+        age = [0] * (num_ver + 1)
+        total_weight = [num_edg]
+
+        # Initialize the cover as in-cover flags (in_cover) and an array of its vertices (cover_list, cover_pos[v] is the position of v)
+        in_cover = bytearray(num_ver + 1)
+        cover_list = []
+        cover_pos = [0] * (num_ver + 1)
+        # Initialize the uncovered edges as an array (uncovered, uncov_pos[e] is the position of edge e or -1 if e is covered)
+        uncovered = list(range(num_edg))
+        uncov_pos = list(range(num_edg))
+
+        # This helper function marks edge e as covered
+        def cover_edge(e):
+            last = uncovered.pop()
+            if last != e:
+                uncovered[uncov_pos[e]] = last
+                uncov_pos[last] = uncov_pos[e]
+            uncov_pos[e] = -1
+
+        # This helper function marks edge e as uncovered
+        def uncover_edge(e):
+            uncov_pos[e] = len(uncovered)
+            uncovered.append(e)
+
+        # This helper function adds vertex v to the cover and updates the scores and uncovered edges around it in O(deg(v))
+        def add(v):
+            in_cover[v] = 1
+            cover_pos[v] = len(cover_list)
+            cover_list.append(v)
+            dscore[v] = -dscore[v]
+            for i in range(offsets[v], offsets[v + 1]):
+                u = adjacency[i]
+                e = edge_of[i]
+                if in_cover[u]:
+                    dscore[u] += weight[e]
+                else:
+                    dscore[u] -= weight[e]
+                    conf_change[u] = 1
+                    cover_edge(e)
+
+        # This helper function removes vertex v from the cover and updates the scores and uncovered edges around it in O(deg(v))
+        def remove(v):
+            in_cover[v] = 0
+            last = cover_list.pop()
+            if last != v:
+                cover_list[cover_pos[v]] = last
+                cover_pos[last] = cover_pos[v]
+            dscore[v] = -dscore[v]
+            conf_change[v] = 0
+            for i in range(offsets[v], offsets[v + 1]):
+                u = adjacency[i]
+                e = edge_of[i]
+                if in_cover[u]:
+                    dscore[u] -= weight[e]
+                else:
+                    dscore[u] += weight[e]
+                    conf_change[u] = 1
+                    uncover_edge(e)
+
+        # Build the initial vertex cover: every vertex starts with the weight of its (all uncovered) edges as its score, the vertices of the
+        # warm start cover are added, then the end point of higher degree of every still uncovered edge is added, and finally the redundant
+        # vertices (score 0) are removed again
+        for v in range(1, num_ver + 1):
+            dscore[v] = offsets[v + 1] - offsets[v]
+        if self.warm_start is not None:
+            for v in self.warm_start:
+                if not in_cover[v]:
+                    add(v)
+        for e in range(num_edg):
+            if uncov_pos[e] != -1:
+                u, v = edge_u[e], edge_v[e]
+                add(u if offsets[u + 1] - offsets[u] >= offsets[v + 1] - offsets[v] else v)
+        for v in list(cover_list):
+            if dscore[v] == 0:
+                remove(v)
+
+        # Initialize the improved solutions (improved_solution) with the initial vertex cover and keep a copy of the best MVC solution
+        improved_solution = self.new_trace()
+        improved_solution.append((time.time() - start, len(cover_list)))
+        best_vc_size = len(cover_list)
+        best_vc = list(cover_list)
+
+        # Initialize the step counter (moves, one move is one added or removed vertex) and the vertex that must not be removed right after being added
+        moves = 0
+        tabu = 0
+
+        # Record the time duration (runtime) before the following while loop
+        runtime = time.time() - start
+
+        # Iterate until the runtime exceeding the cutoff time threshold (the clock is read every CLOCK_CHECK_INTERVAL steps), exchanging
+        # the best MVC solution with the other workers of a portfolio run every SYNC_INTERVAL seconds (next_sync)
+        step = 0
+        next_sync = 0
+        # Initialize the counters of candidate vertices scored (tried), weight forgetting rounds, restarts from another worker's solution, and clock reads
+        tried = forgets = restarts = clock_checks = 0
+        # A graph with edges needs at least one cover vertex, so a cover of one vertex is optimal (and removing it would empty cover_list)
+        while runtime < cutoff_time and best_vc_size > 1:
+            step += 1
+            # The current solution is a vertex cover: record it if it is improved, then remove the cover vertex with the highest score
+            if not uncovered:
+                if len(cover_list) < best_vc_size:
+                    best_vc_size = len(cover_list)
+                    best_vc = list(cover_list)
+                    improved_solution.append((time.time() - start, best_vc_size))
+                if len(cover_list) <= 1:
+                    break
+                best = cover_list[0]
+                for v in cover_list:
+                    if dscore[v] > dscore[best]:
+                        best = v
+                remove(best)
+                age[best] = step
+                moves += 1
+                tried += len(cover_list) + 1
+                # Read the clock here too, since this step skips the clock read at the end of the loop
+                if step % CLOCK_CHECK_INTERVAL == 0:
+                    runtime = time.time() - start
+                    clock_checks += 1
+                continue
+
+            # Remove the best cover vertex (highest score, then oldest) among REMOVE_SAMPLES random ones, but not the vertex just added
+            best = 0
+            for k in range(REMOVE_SAMPLES if cover_list else 0):
+                v = cover_list[random.randrange(len(cover_list))]
+                if v != tabu and (best == 0 or dscore[v] > dscore[best] or (dscore[v] == dscore[best] and age[v] < age[best])):
+                    best = v
+            if best:
+                remove(best)
+                age[best] = step
+                moves += 1
+
+            # Add the end point of a random uncovered edge with the higher score (then older) among those whose configuration changed
+            e = uncovered[random.randrange(len(uncovered))]
+            u, v = edge_u[e], edge_v[e]
+            if not conf_change[u] or (conf_change[v] and (dscore[v] > dscore[u] or (dscore[v] == dscore[u] and age[v] < age[u]))):
+                u = v
+            add(u)
+            age[u] = step
+            tabu = u
+            moves += 1
+            tried += REMOVE_SAMPLES + 2
+
+            # Raise the weight of every uncovered edge, which raises the scores of both of its end points
+            for e in uncovered:
+                weight[e] += 1
+                dscore[edge_u[e]] += 1
+                dscore[edge_v[e]] += 1
+            total_weight[0] += len(uncovered)
+
+            # Forget part of the weights once the average edge weight exceeds WEIGHT_THRESHOLD, and recompute the scores
+            if total_weight[0] > WEIGHT_THRESHOLD * num_edg:
+                forgets += 1
+                for e in range(num_edg):
+                    weight[e] = int(weight[e] * WEIGHT_FORGET)
+                    if weight[e] < 1:
+                        weight[e] = 1
+                total_weight[0] = sum(weight)
+                for v in range(1, num_ver + 1):
+                    dscore[v] = 0
+                for e in range(num_edg):
+                    u, v = edge_u[e], edge_v[e]
+                    if not in_cover[u] and not in_cover[v]:
+                        dscore[u] += weight[e]
+                        dscore[v] += weight[e]
+                    elif in_cover[u] and not in_cover[v]:
+                        dscore[u] -= weight[e]
+                    elif in_cover[v] and not in_cover[u]:
+                        dscore[v] -= weight[e]
+
+            # Record the corrent run time every CLOCK_CHECK_INTERVAL steps and report the counters
+            if step % CLOCK_CHECK_INTERVAL == 0:
+                runtime = time.time() - start
+                clock_checks += 1
+                if self.stats is not None:
+                    self.stats.count("LS3", steps=step, moves_tried=tried, moves_accepted=moves, weight_forgets=forgets, restarts=restarts, clock_checks=clock_checks)
+
+                # Restart from a better solution found by another worker of a portfolio run (swapping in its vertices keeps the scores exact)
+                if self.incumbent is not None and runtime >= next_sync:
+                    next_sync = runtime + SYNC_INTERVAL
+                    shared = self.sync_incumbent(best_vc_size, best_vc)
+                    if shared is not None:
+                        best_vc_size, best_vc = shared
+                        target = bytearray(num_ver + 1)
+                        for v in best_vc:
+                            target[v] = 1
+                            if not in_cover[v]:
+                                add(v)
+                        for v in list(cover_list):
+                            if not target[v]:
+                                remove(v)
+                        tabu = 0
+                        restarts += 1
+
+        # Record the number of moves and the moves per second of the search, and report the final counters
+        runtime = time.time() - start
+        self.search_stats = {"moves": moves, "moves_per_second": moves / runtime if runtime > 0 else 0.0}
+        if self.stats is not None:
+            self.stats.count("LS3", steps=step, moves_tried=tried, moves_accepted=moves, weight_forgets=forgets, restarts=restarts, clock_checks=clock_checks)
+
+        # Return best VC value, best MVC solution, and improved solutions
+        return best_vc_size, best_vc, improved_solution
+
     # This helper function checks if the input vertex cover (vertex_cover) is valid (covering all the edges of graph G) if removing the input vertex (cur_vertex)
     def check_valid_vc(self, vertex_cover, cur_vertex, G):
         # Retrieve all the neighbors of the cur_vertex
-        cur_neighbors = list(G.neighbors(cur_vertex))
+        cur_neighbors = G.neighbors(cur_vertex)
         
         # Iterate each neighbor of the neighbors of the cur_vertex
         for neighbor in cur_neighbors:
@@ -329,6 +1912,328 @@ class RunMVC:
         # Return True if all the neighbors of the cur_vertex are in the input vertex cover (removing cur_vertex does not affect the covered edged by the vertex cover)
         return True
 
+    # This function calls the corresponding mvc method function on G and returns its best VC value, best MVC solution, and improved solutions
+    def run_method(self, G, mvc_method, cutoff_time, random_seed, bound="matching"):
+        # A graph without edges (e.g. a fully reduced kernel) is covered by the empty set
+        if G.number_of_edges() == 0:
+            return 0, [], [(0, 0)]
+        if mvc_method == "BnB":
+            return self.branch_and_bound(G, cutoff_time, bound)
+        elif mvc_method == "Approx":
+            return self.heuristic_approximation(G, cutoff_time, random_seed)
+        elif mvc_method == "ApproxGreedy":
+            return self.greedy_approximation(G, cutoff_time, random_seed)
+        elif mvc_method == "LS1":
+            return self.hill_climbing(G, cutoff_time, random_seed)
+        elif mvc_method == "LS2":
+            return self.simulated_annealing(G, cutoff_time, random_seed)
+        elif mvc_method == "LS3":
+            return self.weighted_local_search(G, cutoff_time, random_seed)
+
+    # This function splits G into its connected components with a breadth-first search over the CSR arrays in O(V + E). It returns the
+    # components with at least one edge as (vertices in breadth-first order, edge count), and the breadth-first parent of every vertex
+    # (0 for the first vertex of a component); isolated vertices are left out since they are never needed in the cover
+    def split_components(self, G):
+        offsets = G.offsets
+        adjacency = G.adjacency
+        num_ver = G.number_of_nodes()
+        parent = array('i', bytes(4 * (num_ver + 1)))
+        seen = bytearray(num_ver + 1)
+        components = []
+        for root in range(1, num_ver + 1):
+            if seen[root] or offsets[root + 1] == offsets[root]:
+                continue
+            # Visit the component of root, counting the end points of its edges (every edge is counted twice)
+            seen[root] = 1
+            order = [root]
+            ends = 0
+            i = 0
+            while i < len(order):
+                v = order[i]
+                i += 1
+                ends += offsets[v + 1] - offsets[v]
+                for j in range(offsets[v], offsets[v + 1]):
+                    u = adjacency[j]
+                    if not seen[u]:
+                        seen[u] = 1
+                        parent[u] = v
+                        order.append(u)
+            components.append((order, ends // 2))
+        return components, parent
+
+    # This function computes a minimum vertex cover of a tree component (including stars and paths) in O(V): walking the breadth-first
+    # order backwards, every edge between a vertex and its parent that is still uncovered is covered by the parent, which is always optimal
+    def tree_cover(self, order, parent):
+        in_cover = {}
+        vertex_cover = []
+        for k in range(len(order) - 1, 0, -1):
+            v = order[k]
+            if v not in in_cover and parent[v] not in in_cover:
+                in_cover[parent[v]] = True
+                vertex_cover.append(parent[v])
+        return vertex_cover
+
+    # This function builds the subgraph of G induced by one component (vertices of the component) with the vertices renumbered from 1
+    # in the given order, so that vertex i of the subgraph is vertex vertices[i - 1] of G
+    def component_graph(self, G, vertices):
+        offsets = G.offsets
+        adjacency = G.adjacency
+        local = {}
+        for v in vertices:
+            local[v] = len(local) + 1
+        return CSRGraph.from_adjacency([[]] + [[local[adjacency[j]] for j in range(offsets[v], offsets[v + 1])] for v in vertices])
+
+    # This function is the body of one worker process of solve_components: it runs mvc_method on one component (task holds the component
+    # index, its subgraph, its vertices and its share of the cutoff time) until the share is used up or the common deadline (start +
+    # cutoff_time) is reached, and returns its cover in the vertex IDs of G with its time logs shifted to the start of the run (and its
+    # counters if the instrumentation is turned on)
+    def component_worker(self, task):
+        index, H, vertices, share, mvc_method, cutoff_time, random_seed, bound, start, warm_start = task
+        self.warm_start = warm_start
+        if self.stats is not None:
+            self.stats = SolverStats()
+        worker_start = time.time()
+        vertex_cover_size, vertex_cover, improved_solution = self.run_method(H, mvc_method, max(min(share, cutoff_time - (worker_start - start)), 0), random_seed, bound)
+        shift = worker_start - start
+        moves = self.search_stats["moves"] if mvc_method == "LS3" else 0
+        return index, [vertices[v - 1] for v in vertex_cover], [(t + shift, size) for t, size in improved_solution], moves, self.stats.counters if self.stats is not None else None
+
+    # This function solves G component by component, since a minimum vertex cover of G is the union of minimum vertex covers of its
+    # connected components: tree components are solved exactly by tree_cover, and the other components are given to mvc_method in
+    # parallel worker processes (largest first, one per CPU), each with a share of the cutoff time proportional to its edge count
+    # (scaled up by the number of parallel workers). It returns the best VC value, the best MVC solution, and the improved solutions,
+    # whose VC values are the sums of the best VC values of all the components at that time
+    def solve_components(self, G, mvc_method, cutoff_time, random_seed, bound="matching"):
+        # Start timing and split G into its components
+        start = time.time()
+        components, parent = self.split_components(G)
+
+        # Solve the tree components right away and collect the other components
+        vertex_cover = []
+        others = []
+        for order, num_edg in components:
+            if num_edg == len(order) - 1:
+                vertex_cover.extend(self.tree_cover(order, parent))
+            else:
+                others.append((order, num_edg))
+        others.sort(key=lambda component: -component[1])
+
+        # Renumber the warm start cover for every other component the same way as component_graph does
+        warm_starts = [None] * len(others)
+        if self.warm_start is not None:
+            in_warm_start = bytearray(G.number_of_nodes() + 1)
+            for v in self.warm_start:
+                in_warm_start[v] = 1
+            warm_starts = [[k + 1 for k in range(len(order)) if in_warm_start[order[k]]] for order, num_edg in others]
+
+        # Record the size of the cover after the tree components, with every other component still covered by all of its vertices
+        improved_solution = [(time.time() - start, len(vertex_cover) + sum(len(order) for order, num_edg in others))]
+        moves = 0
+
+        if len(others) == 1:
+            # A single remaining component is solved in this process with the whole remaining time
+            order = others[0][0]
+            H = self.component_graph(G, order)
+            shift = time.time() - start
+            warm_start = self.warm_start
+            self.warm_start = warm_starts[0]
+            size, cover, trace = self.run_method(H, mvc_method, max(cutoff_time - shift, 0), random_seed, bound)
+            self.warm_start = warm_start
+            results = [(0, [order[v - 1] for v in cover], [(t + shift, s) for t, s in trace], self.search_stats["moves"] if mvc_method == "LS3" else 0, None)]
+        elif others:
+            # Otherwise the components are solved in a pool of worker processes, each with its share of the cutoff time
+            num_workers = min(os.cpu_count() or 1, len(others))
+            total_edges = sum(num_edg for order, num_edg in others)
+            tasks = [(i, self.component_graph(G, others[i][0]), others[i][0], cutoff_time * num_workers * others[i][1] / total_edges,
+                      mvc_method, cutoff_time, random_seed, bound, start, warm_starts[i]) for i in range(len(others))]
+            with multiprocessing.Pool(num_workers) as pool:
+                results = list(pool.imap_unordered(self.component_worker, tasks))
+        else:
+            results = []
+
+        # Merge the covers, and merge the time logs by replaying the improvements of all the components in time order
+        size = improved_solution[0][1]
+        best = [len(order) for order, num_edg in others]
+        for index, cover, trace, component_moves, counters in results:
+            vertex_cover.extend(cover)
+            moves += component_moves
+            if counters is not None:
+                self.stats.merge(counters)
+        for t, index, component_size in sorted((t, result[0], s) for result in results for t, s in result[2]):
+            if component_size < best[index]:
+                size -= best[index] - component_size
+                best[index] = component_size
+                # Improvements of several components logged at the same time are combined into one pair
+                if t <= improved_solution[-1][0]:
+                    improved_solution[-1] = (improved_solution[-1][0], size)
+                else:
+                    improved_solution.append((t, size))
+
+        # Report the total number of moves of the edge-weighting local search over all the components
+        runtime = time.time() - start
+        self.search_stats = {"moves": moves, "moves_per_second": moves / runtime if runtime > 0 else 0.0}
+
+        # Return best VC value, best MVC solution, and improved solutions
+        return len(vertex_cover), vertex_cover, improved_solution
+
+    # This helper function exchanges the best MVC solution of a portfolio worker with the shared one (self.incumbent): the local best MVC
+    # solution (best_vc_size, best_vc) is published if it is better, and the shared one is returned as (size, vertices) if it is better,
+    # otherwise None is returned (best_vc can be None if the local best MVC solution is not at hand, then it is not published)
+    def sync_incumbent(self, best_vc_size, best_vc):
+        shared_size = self.incumbent.best_size()
+        if best_vc_size < shared_size and best_vc is not None:
+            self.incumbent.publish(best_vc_size, best_vc)
+        elif shared_size < best_vc_size:
+            return self.incumbent.fetch()
+        return None
+
+    # This function is the body of one worker process of a portfolio run: it runs mvc_method on G against the shared best MVC solution
+    # (incumbent) until the common deadline (start + cutoff_time), publishes its final result and puts it into the results queue with
+    # its time logs shifted to the start of the portfolio run (a BnB worker shares its search tree through stealing if it is not None)
+    # and its counters if the instrumentation is turned on
+    def portfolio_worker(self, index, G, mvc_method, cutoff_time, random_seed, bound, incumbent, start, results, stealing=None):
+        self.incumbent = incumbent
+        self.stealing = stealing if mvc_method == "BnB" else None
+        if self.stats is not None:
+            self.stats = SolverStats()
+        worker_start = time.time()
+        vertex_cover_size, vertex_cover, improved_solution = self.run_method(G, mvc_method, max(cutoff_time - (worker_start - start), 0), random_seed, bound)
+        self.sync_incumbent(vertex_cover_size, vertex_cover)
+        shift = worker_start - start
+        results.put((index, vertex_cover_size, list(vertex_cover), [(t + shift, size) for t, size in improved_solution], self.stats.counters if self.stats is not None else None))
+
+    # This function runs a portfolio of mvc methods (workers, e.g. ["LS3", "BnB", "LS3"]) in parallel worker processes on G within the same
+    # cutoff time, worker i using the seed random_seed + i. G is shared read-only (a memory-mapped graph is re-mapped by each worker from its
+    # cache file, see CSRGraph.__reduce__), and the workers share the best MVC solution found so far (see SharedIncumbent) so that BnB prunes
+    # with it and the local searches restart from it. Several BnB workers split one search tree between them (see WorkStealing). It returns the best VC value, the best MVC solution, and the improved solutions of
+    # all the workers merged into one timeline
+    def run_portfolio(self, G, workers, cutoff_time, random_seed, bound="matching"):
+        # A graph without edges (e.g. a fully reduced kernel) is covered by the empty set
+        if G.number_of_edges() == 0:
+            return 0, [], [(0, 0)]
+
+        # Start timing and launch one worker process per mvc method
+        start = time.time()
+        incumbent = SharedIncumbent(G.number_of_nodes())
+        if self.warm_start is not None:
+            incumbent.publish(len(self.warm_start), self.warm_start)
+        results = multiprocessing.Queue()
+        processes = []
+        # Queue the whole problem (nothing removed, empty partial cover) as the first subproblem of the BnB workers if there are several
+        stealing = None
+        if workers.count("BnB") > 1:
+            stealing = WorkStealing(workers.count("BnB"))
+            stealing.donate(bytes((G.number_of_nodes() >> 3) + 1), b'')
+        for i in range(len(workers)):
+            p = multiprocessing.Process(target=self.portfolio_worker, args=(i, G, workers[i], cutoff_time, random_seed + i, bound, incumbent, start, results, stealing))
+            p.start()
+            processes.append(p)
+
+        # Collect the results of the workers (the queue has to be drained before the workers can exit), giving up on workers that died
+        finished = []
+        while len(finished) < len(workers):
+            try:
+                finished.append(results.get(timeout=1))
+            except queue.Empty:
+                if not any(p.is_alive() for p in processes) and results.empty():
+                    break
+        for p in processes:
+            p.join()
+        if not finished:
+            raise RuntimeError("all portfolio workers failed")
+
+        # Take the best MVC solution of all the workers and merge their time logs, keeping the global improvements only
+        index, vertex_cover_size, vertex_cover, improved_solution, counters = min(finished, key=lambda result: result[1])
+        for result in finished:
+            if result[4] is not None:
+                self.stats.merge(result[4])
+        merged = []
+        for t, size in sorted(entry for result in finished for entry in result[3]):
+            if not merged or size < merged[-1][1]:
+                merged.append((t, size))
+
+        # Return best VC value, best MVC solution, and improved solutions
+        return vertex_cover_size, vertex_cover, merged
+
+    # This helper function lifts the solution of the kernel back to the input graph: every vertex cover size grows by the same offset (one
+    # per lifting log entry), the trace starts with the trivial cover available right after the reduction (kernel_size more vertices) and
+    # the solver's time logs are shifted by reduce_time
+    def lift_solution(self, vertex_cover, improved_solution, lifting, reduce_time, kernel_size):
+        offset = len(lifting[1])
+        lifted_solution = [(reduce_time, offset + kernel_size)]
+        for t, size in improved_solution:
+            if size + offset < lifted_solution[-1][1]:
+                lifted_solution.append((t + reduce_time, size + offset))
+        return self.lift_cover(vertex_cover, lifting), lifted_solution
+
+    # This helper function returns the names of the .sol file and .trace file according to the property of the mvc method (if random seed
+    # is used), with the lower bound providers of BnB in the names when they are given (e.g. jazz_BnB-lp+clique_600.trace)
+    def output_names(self, graph_file, mvc_method, cutoff_time, random_seed, bound=None):
+        if mvc_method != "BnB":
+            name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time) + "_" + str(random_seed)
+        else:
+            if bound is not None:
+                mvc_method = mvc_method + "-" + bound.replace(",", "+")
+            name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time)
+        return name + ".sol", name + ".trace"
+
+    # This helper function writes the .sol file and .trace file with the required format
+    def write_output(self, sol_file_name, trace_file_name, vertex_cover_size, vertex_cover, improved_solution):
+        # Create and write the .sol file with the mvc solution in the ascending order of vertex ID
+        sol_file = open(sol_file_name, 'w')
+        sol_file.write(str(vertex_cover_size) + "\n")
+        sol_file.write(",".join(str(v) for v in sorted(vertex_cover)))
+        sol_file.close()
+
+        # Create and write the .trace file
+        trace_file = open(trace_file_name, 'w')
+        for i in range(len(improved_solution)):
+            trace_file.write(str(improved_solution[i][0]) + ', ' + str(improved_solution[i][1]) + "\n")
+        trace_file.close()
+
+    # This function reads a change file: the number of changes on the first line (as in the .extra files of hw2), then one change per
+    # line, "+ u v" (or just "u v") to insert the edge (u, v) and "- u v" to delete it. It returns the changes as (insert?, u, v) tuples
+    def read_changes(self, change_file):
+        changes = []
+        with open(change_file) as f:
+            f.readline()
+            for line in f:
+                fields = line.split()
+                if not fields:
+                    continue
+                insert = fields[0] != "-"
+                if fields[0] in ("+", "-"):
+                    fields = fields[1:]
+                u, v = int(fields[0]), int(fields[1])
+                if u < 1 or v < 1:
+                    raise ValueError("vertex IDs of a change start from 1: " + line.strip())
+                changes.append((insert, u, v))
+        return changes
+
+    # This function keeps the vertex cover of G valid and near-minimal through the changes with a DynamicCover, and returns the
+    # DynamicCover and the (VC value, update latency in milliseconds) pair of every change
+    def run_changes(self, G, vertex_cover, changes):
+        dynamic = DynamicCover(G, vertex_cover)
+        updates = []
+        for insert, u, v in changes:
+            update_start = time.perf_counter()
+            if insert:
+                dynamic.insert(u, v)
+            else:
+                dynamic.delete(u, v)
+            updates.append((dynamic.size, (time.perf_counter() - update_start) * 1000))
+        if self.stats is not None:
+            self.stats.count("Dynamic", **dynamic.counters)
+        return dynamic, updates
+
+    # This helper function collects the "-name value" pairs of the input arguments into a dictionary
+    def parse_options(self, args):
+        options = {}
+        for i in range(0, len(args) - 1):
+            if args[i].startswith("-"):
+                options[args[i][1:]] = args[i + 1]
+        return options
+
     # This main() function contains modules of parsing input arguments, parsing graph, calling corresponding mvc method function, and writing .sol and .trace file
     def main(self):
         # Count the total number of input arguments
@@ -339,50 +2244,143 @@ class RunMVC:
             print("error: not enough input arguments")
             exit(1)
             
+        # Collect the "-name value" pairs of the input arguments into a dictionary (options)
+        options = self.parse_options(sys.argv[2:])
+
         # Assign the corresponding info to graph_file, mvc_method, cutoff_time, and random_seed from the input arguments
-        graph_file = sys.argv[3]
-        mvc_method = sys.argv[5]
-        cutoff_time = int(sys.argv[7])
-        random_seed = int(sys.argv[9])
-        
-        # Use parse_graph function to parse the targeted graph file and store the graph as G
-        G = self.parse_graph("./DATA/" + graph_file)
-        
-        # Call the corresponding function to generate near-optimal MVC solution according to the input mvc method
-        # and throw an error if the input mvc method is not in the method pool
-        if mvc_method == "BnB":
-            vertex_cover_size, vertex_cover, improved_solution = self.branch_and_bound(G, cutoff_time)
-        elif mvc_method == "Approx":
-            vertex_cover_size, vertex_cover, improved_solution = self.heuristic_approximation(G, cutoff_time, random_seed)
-        elif mvc_method == "LS1":
-            vertex_cover_size, vertex_cover, improved_solution = self.hill_climbing(G, cutoff_time, random_seed)
-        elif mvc_method == "LS2":
-            vertex_cover_size, vertex_cover, improved_solution = self.simulated_annealing(G, cutoff_time, random_seed)
+        graph_file = options["inst"]
+        mvc_method = options["alg"]
+        cutoff_time = int(options["time"])
+        random_seed = int(options["seed"])
+        # Solve the connected components of the graph separately if it is turned on with "-components 1"
+        use_components = options.get("components", "0") != "0"
+        # Use the binary graph cache unless it is turned off with "-cache 0"
+        use_cache = options.get("cache", "1") != "0"
+        # Apply the data reductions before solving if they are turned on with "-reduce 1"
+        use_reduce = options.get("reduce", "0") != "0"
+        # Select the lower bound providers of BnB with "-bound" (e.g. "-bound lp,clique"), the maximal matching bound by default
+        bound = options.get("bound", "matching")
+        # Select the mvc methods of the workers of a portfolio run with "-portfolio", either a worker count (cycling through
+        # PORTFOLIO_METHODS, one worker per CPU by default) or a comma separated list of mvc methods (e.g. "-portfolio BnB,LS3,LS3")
+        workers = options.get("portfolio", str(os.cpu_count() or 1))
+        if workers.isdigit():
+            workers = [PORTFOLIO_METHODS[i % len(PORTFOLIO_METHODS)] for i in range(max(int(workers), 1))]
         else:
+            workers = workers.split(",")
+
+        # Throw an error if the input mvc method is not in the method pool
+        if mvc_method not in MVC_METHODS or any(name not in MVC_METHODS or name == "Portfolio" for name in workers):
             print("error: not correct input method")
+            exit(1)
+        # Throw an error if a lower bound provider is not in the provider pool
+        if any(name not in BOUND_PROVIDERS for name in bound.split(",")):
+            print("error: not correct lower bound provider")
+            exit(1)
+        # Run BnB as a parallel search with "-parallel N", which is a portfolio run of N BnB workers splitting the search tree
+        parallel_bnb = mvc_method == "BnB" and "parallel" in options
+        if parallel_bnb:
+            workers = ["BnB"] * max(int(options["parallel"]), 1)
+        # Throw an error if the components would be solved by portfolio runs (the worker processes cannot start workers of their own)
+        if (mvc_method == "Portfolio" or parallel_bnb) and use_components:
+            print("error: -components cannot be combined with the Portfolio method or -parallel")
+            exit(1)
+
+        # Keep the best verified cover of every graph in a solution store with "-store 1" (in DATA/SolutionStore) or "-store <dir>",
+        # and warm-start the mvc method from it
+        store = None
+        if options.get("store", "0") != "0":
+            store = SolutionStore("./DATA/SolutionStore" if options["store"] == "1" else options["store"])
+
+        # Turn on the instrumentation if its JSON output is requested with "-stats <file>" or "-profile 1" (printed)
+        stats_file = options.get("stats")
+        profile = options.get("profile", "0") != "0"
+        if stats_file or profile:
+            self.stats = SolverStats()
         
-        # Separately define the names of .sol file and .trace file according to the property of the mvc method (if random seed is used)
-        if mvc_method == "LS1" or mvc_method == "LS2" or mvc_method == "Approx":
-            sol_file_name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time) + "_" + str(random_seed) + ".sol"
-            trace_file_name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time) + "_" + str(random_seed) + ".trace"
-        else:
-            sol_file_name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time) + ".sol"
-            trace_file_name = graph_file.split('.')[0] + "_" + mvc_method + "_" + str(cutoff_time) + ".trace"
-        
-        # Sort the mvc solution in the ascending order of vertex ID
-        vertex_cover = sorted(vertex_cover)
+        # Use load_graph function to load the targeted graph file (through its binary cache) and store the graph as G
+        phase_start = time.time()
+        G = self.load_graph("./DATA/" + graph_file, use_cache)
+        if self.stats is not None:
+            self.stats.phase("parse", time.time() - phase_start)
+        input_graph = G
+
+        # Seed the solution store with the example solution of the graph (if there is one) and warm-start from the stored cover;
+        # a cover of the input graph does not carry over to the kernel, so reduced runs start cold and only update the store
+        if store is not None:
+            example_sol = store.read_sol("./DATA/ExampleSolutions/" + graph_file.split('.')[0] + ".sol")
+            if example_sol is not None:
+                store.save(G, example_sol)
+            stored = store.load(G)
+            if stored is not None and not use_reduce:
+                self.warm_start = stored[1]
+
+        # Reduce G to its kernel and record how long the reduction took (reduce_time)
+        reduce_time = 0
+        if use_reduce:
+            reduce_start = time.time()
+            G, lifting = self.reduce_graph(G)
+            reduce_time = time.time() - reduce_start
+            if self.stats is not None:
+                self.stats.phase("reduce", reduce_time)
         
-        # Create and write the .sol file with the required format
-        sol_file = open(sol_file_name, 'w')
-        sol_file.write(str(vertex_cover_size) + "\n")
-        for i in range(vertex_cover_size - 1):
-            sol_file.write(str(vertex_cover[i]) + ',')
-        sol_file.write(str(vertex_cover[vertex_cover_size - 1]))       
+        phase_start = time.time()
+        # Call the corresponding function to generate near-optimal MVC solution according to the input mvc method within the remaining time
+        if mvc_method == "Portfolio" or parallel_bnb:
+            vertex_cover_size, vertex_cover, improved_solution = self.run_portfolio(G, workers, max(cutoff_time - reduce_time, 0), random_seed, bound)
+        elif use_components:
+            vertex_cover_size, vertex_cover, improved_solution = self.solve_components(G, mvc_method, max(cutoff_time - reduce_time, 0), random_seed, bound)
+        else:
+            vertex_cover_size, vertex_cover, improved_solution = self.run_method(G, mvc_method, max(cutoff_time - reduce_time, 0), random_seed, bound)
+
+        # Report the moves per second of the edge-weighting local search
+        if mvc_method == "LS3" and G.number_of_edges() > 0:
+            print("LS3: " + str(self.search_stats["moves"]) + " moves, " + str(round(self.search_stats["moves_per_second"])) + " moves per second")
+
+        # Lift the kernel solution back to the input graph: every vertex cover size grows by the same offset (one per lifting log entry),
+        # the trace starts with the trivial cover available right after the reduction and the solver's time logs are shifted by reduce_time
+        if use_reduce:
+            vertex_cover, improved_solution = self.lift_solution(vertex_cover, improved_solution, lifting, reduce_time, G.number_of_nodes())
+            vertex_cover_size = len(vertex_cover)
+        # Record how long the initial solve took (solve_time, including the reduction)
+        solve_time = reduce_time + time.time() - phase_start
+        if self.stats is not None:
+            self.stats.phase("search", time.time() - phase_start)
         
-        # Create and write the .trace file with the required format
-        trace_file = open(trace_file_name, 'w')
-        for i in range(len(improved_solution)):
-            trace_file.write(str(improved_solution[i][0]) + ', ' + str(improved_solution[i][1]) + "\n")
+        # Write the .sol file and .trace file (the lower bound providers of BnB are reported in the file names when they are selected with "-bound")
+        phase_start = time.time()
+        sol_file_name, trace_file_name = self.output_names(graph_file, mvc_method, cutoff_time, random_seed, options.get("bound"))
+        self.write_output(sol_file_name, trace_file_name, vertex_cover_size, vertex_cover, improved_solution)
+
+        # Offer the solution to the solution store, which keeps it if it is the best verified cover of the graph so far
+        if store is not None:
+            store.save(input_graph, vertex_cover)
+
+        # Keep the solution up to date through the changes of "-changes <file>", and write the VC value and update latency (ms) after
+        # the initial solve (with its time) and after every change to the .dyn file, and the final cover to the .dyn.sol file
+        if "changes" in options:
+            changes = self.read_changes(options["changes"])
+            dynamic, updates = self.run_changes(input_graph, vertex_cover, changes)
+            dyn_file = open(sol_file_name[:-4] + ".dyn", 'w')
+            dyn_file.write(str(vertex_cover_size) + " " + str(solve_time * 1000) + "\n")
+            for size, latency in updates:
+                dyn_file.write(str(size) + " " + str(latency) + "\n")
+            dyn_file.close()
+            self.write_output(sol_file_name[:-4] + ".dyn.sol", os.devnull, dynamic.size, dynamic.cover(), [])
+            if updates:
+                latencies = sorted(latency for size, latency in updates)
+                print("Dynamic: " + str(len(updates)) + " changes, final VC value " + str(dynamic.size) + ", median latency " +
+                      str(round(latencies[len(latencies) // 2], 3)) + " ms, max latency " + str(round(latencies[-1], 3)) + " ms")
+
+        # Write the counters and phase timers as JSON to the "-stats" file and/or print them with "-profile 1"
+        if self.stats is not None:
+            self.stats.phase("write", time.time() - phase_start)
+            report = {"inst": graph_file, "alg": mvc_method, "time": cutoff_time, "seed": random_seed, "vc_size": vertex_cover_size}
+            report.update(self.stats.snapshot())
+            if stats_file:
+                with open(stats_file, 'w') as f:
+                    json.dump(report, f, indent=1)
+            if profile:
+                print(json.dumps(report))
 
 # Initialize the RunMVC() class and execute the main() function
 if __name__ == '__main__':
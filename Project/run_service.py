@@ -0,0 +1,315 @@
+#!/usr/bin/python
+# CSE6140 Project
+# This is a long-running solver service for run_mvc.py: it keeps the graphs resident in its worker processes between solve requests,
+# so many short solves do not pay for the interpreter startup and the graph loading each time
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from run_mvc import RunMVC, MVC_METHODS, BOUND_PROVIDERS
+
+# Define the number of graphs (or kernels) every worker process keeps in its LRU graph cache by default
+GRAPH_CACHE_SIZE = 8
+# Define the mvc methods the service runs (Portfolio starts worker processes of its own, which a pool worker cannot do)
+SERVICE_METHODS = [name for name in MVC_METHODS if name != "Portfolio"]
+
+# The state of a worker process of the service: the queue its trace events go to, its LRU graph cache and its settings
+worker_state = {}
+
+# This function initializes a worker process of the service with the shared event queue, its graph cache size and the data directory
+def init_worker(events, cache_size, data_dir):
+    worker_state["events"] = events
+    worker_state["graphs"] = OrderedDict()
+    worker_state["cache_size"] = cache_size
+    worker_state["data_dir"] = data_dir
+
+# This function returns the graph (or its kernel, lifting log and reduction time when use_reduce is set) of graph_file from the LRU graph
+# cache of the worker, loading it on a miss and evicting the least recently used graph when the cache is full; a graph file that changed
+# on disk since it was loaded is loaded again. The reduction time is 0 when the kernel was already in the cache
+def cached_graph(runmvc, graph_file, use_reduce):
+    graphs = worker_state["graphs"]
+    path = os.path.join(worker_state["data_dir"], graph_file)
+    key = (path, use_reduce)
+    mtime = os.stat(path).st_mtime_ns
+    entry = graphs.get(key)
+    if entry is not None and entry[0] == mtime:
+        graphs.move_to_end(key)
+        return entry[1], entry[2], 0
+    G = runmvc.load_graph(path)
+    lifting = None
+    reduce_time = 0
+    if use_reduce:
+        reduce_start = time.time()
+        G, lifting = runmvc.reduce_graph(G)
+        reduce_time = time.time() - reduce_start
+    graphs[key] = (mtime, G, lifting)
+    while len(graphs) > worker_state["cache_size"]:
+        graphs.popitem(last=False)
+    return G, lifting, reduce_time
+
+# This function runs one solve request (job_id is the service's id for it) in a worker process. Every improved solution is put into the
+# event queue as soon as the solver finds it, followed by the result (the lifted vertex cover and trace); both are put in by the worker
+# itself so that the result of a job is never forwarded before its trace events
+def solve_job(job_id, request):
+    events = worker_state["events"]
+    runmvc = RunMVC()
+    use_reduce = bool(request.get("reduce", 0))
+    G, lifting, reduce_time = cached_graph(runmvc, request["inst"], use_reduce)
+    offset = len(lifting[1]) if use_reduce else 0
+    # Stream the improved solutions of the input graph (the kernel solutions grow by the lifting offset and start after the reduction)
+    runmvc.trace_callback = lambda entry: events.put((job_id, "trace", {"time": entry[0] + reduce_time, "vc_size": entry[1] + offset}))
+    if use_reduce:
+        events.put((job_id, "trace", {"time": reduce_time, "vc_size": offset + G.number_of_nodes()}))
+    cutoff_time = request["time"]
+    vertex_cover_size, vertex_cover, improved_solution = runmvc.run_method(G, request["alg"], max(cutoff_time - reduce_time, 0),
+                                                                           request["seed"], request.get("bound", "matching"))
+    if use_reduce:
+        vertex_cover, improved_solution = runmvc.lift_solution(vertex_cover, improved_solution, lifting, reduce_time, G.number_of_nodes())
+        vertex_cover_size = len(vertex_cover)
+    events.put((job_id, "result", {"vc_size": vertex_cover_size, "cover": sorted(vertex_cover), "trace": list(improved_solution)}))
+
+# Define the StdioWriter class that gives stdout the write method of the stream writers of the socket connections
+class StdioWriter:
+
+    # This function writes the encoded event line to stdout right away
+    def write(self, data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+# Define the RunService class, which serves JSON-lines solve requests on a Unix socket or on stdin/stdout. A request is one JSON object
+# per line, {"id": ..., "inst": ..., "alg": ..., "time": ..., "seed": ...} with optional "bound" and "reduce"; the service answers it with
+# {"id": ..., "event": "trace", "time": ..., "vc_size": ...} lines while the solver improves, then one {"id": ..., "event": "result",
+# "vc_size": ..., "cover": [...], "trace": [...]} line, or one {"id": ..., "event": "error", "message": ...} line
+class RunService:
+
+    # This function checks a decoded solve request and fills in its defaults. It returns the error message of a bad request (None if
+    # the request is fine)
+    def check_request(self, request):
+        if not isinstance(request, dict):
+            return "request is not a JSON object"
+        if any(name not in request for name in ("inst", "alg", "time", "seed")):
+            return "request needs inst, alg, time and seed"
+        if request["alg"] not in SERVICE_METHODS:
+            return "not correct input method"
+        request.setdefault("bound", "matching")
+        if any(name not in BOUND_PROVIDERS for name in str(request["bound"]).split(",")):
+            return "not correct lower bound provider"
+        try:
+            request["time"] = int(request["time"])
+            request["seed"] = int(request["seed"])
+        except (TypeError, ValueError):
+            return "time and seed must be integers"
+        if not os.path.isfile(os.path.join(self.data_dir, str(request["inst"]))):
+            return "no such graph file: " + str(request["inst"])
+        return None
+
+    # This function sends one event (a dictionary) as a JSON line to writer
+    def send(self, writer, event):
+        writer.write((json.dumps(event) + "\n").encode())
+
+    # This function handles one request line of a client (writer is where its events go): it submits a good request to the worker pool
+    # under a new job id, and answers a bad one with an error event
+    def handle_line(self, line, writer):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            self.send(writer, {"id": None, "event": "error", "message": "request is not valid JSON"})
+            return
+        message = self.check_request(request)
+        if message is not None:
+            self.send(writer, {"id": request.get("id") if isinstance(request, dict) else None, "event": "error", "message": message})
+            return
+        self.next_job += 1
+        job_id = self.next_job
+        self.jobs[job_id] = (request.get("id"), writer)
+        future = self.loop.run_in_executor(self.pool, solve_job, job_id, request)
+        future.add_done_callback(lambda done: self.job_done(job_id, done))
+
+    # This function answers a job whose worker raised an error (the result of a finished job comes through the event queue)
+    def job_done(self, job_id, future):
+        if future.cancelled() or future.exception() is not None:
+            request_id, writer = self.jobs.pop(job_id)
+            message = "cancelled" if future.cancelled() else repr(future.exception())
+            self.send(writer, {"id": request_id, "event": "error", "message": message})
+            self.check_idle()
+
+    # This function forwards one event of the queue (a trace event or the result of job_id) to the client of the job
+    def forward(self, job_id, kind, event):
+        if job_id not in self.jobs:
+            return
+        if kind == "result":
+            request_id, writer = self.jobs.pop(job_id)
+        else:
+            request_id, writer = self.jobs[job_id]
+        event = dict({"id": request_id, "event": kind}, **event)
+        try:
+            self.send(writer, event)
+        except (ConnectionError, RuntimeError):
+            pass
+        self.check_idle()
+
+    # This function wakes up a service waiting for its last jobs (stdin was closed) when no job is left
+    def check_idle(self):
+        if self.stdin_done and not self.jobs and not self.closing.done():
+            self.closing.set_result(None)
+
+    # This function is the body of the thread that moves the events of the worker processes from the event queue to the event loop
+    def drain_events(self):
+        while True:
+            item = self.events.get()
+            if item is None:
+                return
+            self.loop.call_soon_threadsafe(self.forward, *item)
+
+    # This function is the body of the thread that reads the request lines from stdin and hands them to the event loop
+    def read_stdin(self, writer):
+        for line in sys.stdin:
+            self.loop.call_soon_threadsafe(self.handle_line, line, writer)
+        self.loop.call_soon_threadsafe(self.stdin_closed)
+
+    # This function lets a stdin/stdout service stop as soon as the jobs of the closed stdin are answered
+    def stdin_closed(self):
+        self.stdin_done = True
+        self.check_idle()
+
+    # This function serves one client connection of the Unix socket: every line it sends is a solve request
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.handle_line(line.decode(), writer)
+        except ConnectionError:
+            pass
+
+    # This function runs the service until it is interrupted (on the Unix socket at socket_path) or until stdin is closed and answered
+    # (when socket_path is None)
+    async def serve(self, socket_path):
+        self.loop = asyncio.get_running_loop()
+        self.jobs = {}
+        self.next_job = 0
+        self.closing = self.loop.create_future()
+        self.stdin_done = False
+        drain = threading.Thread(target=self.drain_events, daemon=True)
+        drain.start()
+        if socket_path is None:
+            threading.Thread(target=self.read_stdin, args=(StdioWriter(),), daemon=True).start()
+            await self.closing
+        else:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(self.serve_client, path=socket_path)
+            # Stop serving on SIGTERM the same way as on SIGINT, so that the socket file is removed
+            self.loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+            print("serving on " + socket_path, file=sys.stderr)
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+        self.events.put(None)
+        drain.join()
+
+    # This function starts the worker pool (with its event queue and graph caches) and runs the service on it, on the Unix socket of
+    # "-socket" (./mvc.sock by default) or on stdin/stdout with "-stdio 1"
+    def run_server(self, options):
+        self.data_dir = options.get("data", "./DATA")
+        workers = int(options.get("workers", os.cpu_count() or 1))
+        self.events = multiprocessing.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=max(workers, 1), initializer=init_worker,
+                                        initargs=(self.events, max(int(options.get("graphs", GRAPH_CACHE_SIZE)), 1), self.data_dir))
+        # Start the worker processes before any thread of the service is running, since they are forked from this process
+        self.pool.submit(os.getpid).result()
+        try:
+            asyncio.run(self.serve(None if options.get("stdio", "0") != "0" else options.get("socket", "./mvc.sock")))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+    # This function is the thin client of the service: it sends solve requests to the service at the "-socket" path and writes the same
+    # .sol file and .trace file for every result as run_mvc.py. The request is either given with the options of run_mvc.py (its
+    # improved solutions are printed as they arrive) or read from the JSON-lines file of "-requests", whose requests are all sent at once
+    # over the same connection so that the workers solve them back to back
+    def run_client(self, options):
+        if "requests" in options:
+            with open(options["requests"]) as f:
+                requests = [json.loads(line) for line in f if line.strip()]
+        else:
+            requests = [{"inst": options["inst"], "alg": options["alg"], "time": int(options["time"]), "seed": int(options["seed"]),
+                         "reduce": int(options.get("reduce", "0") != "0")}]
+            if "bound" in options:
+                requests[0]["bound"] = options["bound"]
+        # Number the requests to match their events with them
+        for i in range(len(requests)):
+            requests[i]["id"] = i
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(options.get("socket", "./mvc.sock"))
+        client.sendall("".join(json.dumps(request) + "\n" for request in requests).encode())
+        runmvc = RunMVC()
+        failed = False
+        pending = len(requests)
+        lines = client.makefile()
+        while pending > 0:
+            line = lines.readline()
+            if not line:
+                print("error: the service closed the connection")
+                exit(1)
+            event = json.loads(line)
+            if event["event"] == "trace":
+                if len(requests) == 1:
+                    print(str(event["time"]) + ", " + str(event["vc_size"]))
+                continue
+            pending -= 1
+            if event["id"] is None:
+                failed = True
+                print("error: " + event["message"])
+                continue
+            request = requests[event["id"]]
+            if event["event"] == "error":
+                failed = True
+                print("error: " + request["inst"] + " " + request["alg"] + ": " + event["message"])
+                continue
+            sol_file_name, trace_file_name = runmvc.output_names(request["inst"], request["alg"], request["time"], request["seed"],
+                                                                 request.get("bound"))
+            runmvc.write_output(sol_file_name, trace_file_name, event["vc_size"], event["cover"], event["trace"])
+            if len(requests) > 1:
+                print(sol_file_name + " " + str(event["vc_size"]))
+        client.close()
+        if failed:
+            exit(1)
+
+    # This function is the main function: "serve" starts the service and "exec" sends it solve requests
+    def main(self):
+        # Throw an error if the sub-command is missing
+        if len(sys.argv) < 2 or sys.argv[1] not in ("serve", "exec"):
+            print("usage: run_service.py serve [-socket <path> | -stdio 1] [-workers N] [-graphs N] [-data <dir>]")
+            print("       run_service.py exec -inst <graph> -alg <method> -time <cutoff> -seed <seed> [-bound ...] [-reduce 1] [-socket <path>]")
+            print("       run_service.py exec -requests <file> [-socket <path>]")
+            exit(1)
+        # Collect the "-name value" pairs of the input arguments into a dictionary (options)
+        options = RunMVC().parse_options(sys.argv[2:])
+        if sys.argv[1] == "serve":
+            self.run_server(options)
+        else:
+            # Throw an error if neither a request nor a request file is given
+            if "requests" not in options and any(name not in options for name in ("inst", "alg", "time", "seed")):
+                print("error: not enough input arguments")
+                exit(1)
+            self.run_client(options)
+
+# Initialize the RunService() class and execute the main() function
+if __name__ == '__main__':
+    runservice = RunService()
+    runservice.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# CSE6140 HW2
+# Seeded R-MAT graph and change-stream generator, writing the .gr/.extra files run_experiment.py reads:
+# rmatXXYY.gr has 2^XX vertices and up to 2^YY edges ("N E" on the first line, then "u v weight" per edge, vertices 0..N-1): a random
+# spanning tree keeps it connected, the other edges are R-MAT edges, and self-loops and duplicate pairs are dropped,
+# rmatXXYY.extra has the number of changes on the first line, then one change per line
+# ("u v weight" inserts an edge, "d u v" deletes one, "w u v weight" sets the weight of one).
+# usage: python generate_rmat.py <XX> <YY> <output folder> [-seed 1] [-changes 1000] [-delete 0.0] [-reweight 0.0]
+#                                [-weights 1,100] [-change_weights 1,10] [-rmat 0.45,0.15,0.15]
+
+import os
+import sys
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Generate_RMAT:
+    def rmat_pairs(self, rng, scale, count, a, b, c):
+        # R-MAT: every vertex bit picks one quadrant of the adjacency matrix, top-left with probability a, top-right b,
+        # bottom-left c and bottom-right 1 - a - b - c (one bit level at a time, so memory stays O(count))
+        us = np.zeros(count, dtype=np.int64)
+        vs = np.zeros(count, dtype=np.int64)
+        for level in range(scale):
+            r = rng.random(count)
+            us |= (r >= a + b).astype(np.int64) << level
+            vs |= (((r >= a) & (r < a + b)) | (r >= a + b + c)).astype(np.int64) << level
+        return us, vs
+
+    def backbone(self, rng, N):
+        # random spanning tree over 0..N-1 (vertex i of a random order hangs off a random earlier one), so the graph is connected and
+        # computeMST returns a spanning tree like for the hw2 inputs
+        order = rng.permutation(N)
+        parents = order[(rng.random(N - 1) * np.arange(1, N)).astype(np.int64)]
+        return order[1:], parents
+
+    def generate_graph(self, rng, scale, edge_scale, weights, rmat):
+        # the backbone plus 2^YY - (N - 1) R-MAT edges, without self-loops and duplicate pairs (so the file may hold a few edges less
+        # than 2^YY; the header has the number of edges actually written)
+        N, E = 1 << scale, 1 << edge_scale
+        tree_us, tree_vs = self.backbone(rng, N)
+        rmat_us, rmat_vs = self.rmat_pairs(rng, scale, max(E - (N - 1), 0), *rmat)
+        us = np.concatenate([tree_us, rmat_us])
+        vs = np.concatenate([tree_vs, rmat_vs])
+        pair = np.minimum(us, vs) * N + np.maximum(us, vs)
+        first = np.unique(pair, return_index=True)[1]
+        keep = np.sort(first[us[first] != vs[first]])
+        us, vs = us[keep], vs[keep]
+        ws = rng.integers(weights[0], weights[1] + 1, len(us))
+        return N, us, vs, ws
+
+    def generate_changes(self, rng, scale, graph, count, delete, reweight, weights, change_weights, rmat):
+        # a change deletes a random edge of the graph with probability delete, makes one heavier with probability reweight,
+        # and inserts a new R-MAT edge with a (light) weight from change_weights otherwise
+        N, us, vs, ws = graph
+        kind = rng.random(count)
+        picks = rng.integers(0, len(us), count)
+        new_us, new_vs = self.rmat_pairs(rng, scale, count, *rmat)
+        # no self-loops among the inserted edges either
+        loops = new_us == new_vs
+        new_vs[loops] = (new_vs[loops] + 1) % N
+        new_ws = rng.integers(change_weights[0], change_weights[1] + 1, count)
+        heavier = rng.integers(1, weights[1] - weights[0] + 2, count)
+        lines = []
+        for i in range(count):
+            e = picks[i]
+            if kind[i] < delete:
+                lines.append("d %d %d" % (us[e], vs[e]))
+            elif kind[i] < delete + reweight:
+                lines.append("w %d %d %d" % (us[e], vs[e], ws[e] + heavier[i]))
+            else:
+                lines.append("%d %d %d" % (new_us[i], new_vs[i], new_ws[i]))
+        return lines
+
+    def write_graph(self, filename, graph):
+        N, us, vs, ws = graph
+        with open(filename, 'w') as f:
+            f.write("%d %d\n" % (N, len(us)))
+            # write in chunks so the text of a large graph is never in memory at once
+            chunk = 1 << 18
+            for start in range(0, len(us), chunk):
+                rows = zip(us[start:start + chunk].tolist(), vs[start:start + chunk].tolist(), ws[start:start + chunk].tolist())
+                f.write("".join("%d %d %d\n" % row for row in rows))
+
+    def write_changes(self, filename, lines):
+        with open(filename, 'w') as f:
+            f.write(str(len(lines)) + "\n")
+            f.write("".join(line + "\n" for line in lines))
+
+    def generate(self, scale, edge_scale, folder, seed=1, changes=1000, delete=0.0, reweight=0.0, weights=(1, 100), change_weights=(1, 10),
+                 rmat=(0.45, 0.15, 0.15)):
+        # writes folder/rmatXXYY.gr and folder/rmatXXYY.extra and returns their paths; the same arguments always give the same files
+        if np is None:
+            print("error: generate_rmat.py needs numpy")
+            exit(1)
+        rng = np.random.default_rng([seed, scale, edge_scale])
+        name = os.path.join(folder, "rmat%02d%02d" % (scale, edge_scale))
+        os.makedirs(folder, exist_ok=True)
+        graph = self.generate_graph(rng, scale, edge_scale, weights, rmat)
+        self.write_graph(name + ".gr", graph)
+        self.write_changes(name + ".extra", self.generate_changes(rng, scale, graph, changes, delete, reweight, weights, change_weights, rmat))
+        return name + ".gr", name + ".extra"
+
+    def main(self):
+        if len(sys.argv) < 4:
+            print("error: not enough input arguments")
+            exit(1)
+        options = dict(zip(sys.argv[4::2], sys.argv[5::2]))
+        pair = lambda text: tuple(int(x) for x in text.split(','))
+        files = self.generate(int(sys.argv[1]), int(sys.argv[2]), sys.argv[3],
+                              seed=int(options.get('-seed', '1')),
+                              changes=int(options.get('-changes', '1000')),
+                              delete=float(options.get('-delete', '0.0')),
+                              reweight=float(options.get('-reweight', '0.0')),
+                              weights=pair(options.get('-weights', '1,100')),
+                              change_weights=pair(options.get('-change_weights', '1,10')),
+                              rmat=tuple(float(x) for x in options.get('-rmat', '0.45,0.15,0.15').split(',')))
+        print(files[0] + " " + files[1])
+
+if __name__ == '__main__':
+    Generate_RMAT().main()
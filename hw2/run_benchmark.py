@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# CSE6140 HW2
+# Scaling benchmark of the MST pipeline: generates the R-MAT inputs (generate_rmat.py) that are missing, runs run_experiment.py on every
+# scale with every MST backend, and tabulates the initial MST time, the update latency percentiles, the update throughput and the
+# peak memory of each run next to the numbers of the hw2 results/*.txt baselines (and how much each one grows from one scale to the next).
+# usage: python run_benchmark.py [-scales 0507,0608,...,1618] [-backends kruskal,boruvka] [-workers 1] [-data ../data] [-out benchmark]
+#                                [-seed 1] [-changes 1000] [-delete 0.0] [-reweight 0.0]
+# writes <out>/summary.tsv (and <out>/scaling.png if matplotlib is installed); the outputs of the runs go to <out>/runs
+
+import os
+import subprocess
+import sys
+import time
+from generate_rmat import Generate_RMAT
+
+SCALES = ["0507", "0608", "0709", "0810", "0911", "1012", "1113", "1214", "1315", "1416", "1517", "1618"]
+COLUMNS = ["scale", "backend", "init_mst_wt", "init_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms", "updates_per_s", "peak_mb",
+           "init_growth", "p50_growth"]
+
+class Run_Benchmark:
+    def read_output(self, filename):
+        # first line: initial MST weight and time (ms), then the MST weight and time (ms) after every change
+        rows = []
+        with open(filename) as f:
+            for line in f:
+                fields = line.split()
+                if fields:
+                    rows.append((int(fields[0]), float(fields[1])))
+        return rows
+
+    def percentile(self, values, q):
+        # nearest-rank percentile of sorted values
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, max(0, int(round(q * len(values) + 0.5)) - 1))]
+
+    def summarize(self, rows, peak_mb):
+        latencies = sorted(t for w, t in rows[1:])
+        total = sum(latencies)
+        return {"init_mst_wt": rows[0][0], "init_ms": rows[0][1],
+                "p50_ms": self.percentile(latencies, 0.5), "p90_ms": self.percentile(latencies, 0.9),
+                "p99_ms": self.percentile(latencies, 0.99), "max_ms": latencies[-1] if latencies else 0.0,
+                "updates_per_s": len(latencies) / (total / 1000) if total > 0 else float('inf'), "peak_mb": peak_mb}
+
+    def run_once(self, graph_file, change_file, output_file, backend, workers):
+        # run run_experiment.py in its own process so its peak memory (max RSS, from wait4) is its own
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_experiment.py")
+        process = subprocess.Popen([sys.executable, script, graph_file, change_file, output_file, "-mst", backend, "-workers", str(workers)])
+        pid, status, usage = os.wait4(process.pid, 0)
+        process.returncode = status
+        if status != 0:
+            print("error: run_experiment.py failed on " + graph_file + " with " + backend)
+            return None
+        return self.summarize(self.read_output(output_file), usage.ru_maxrss / 1024)
+
+    def add_growth(self, rows):
+        # growth of the initial MST time and of the median update latency from the previous scale of the same backend
+        previous = {}
+        for row in rows:
+            last = previous.get(row["backend"])
+            for column, growth in (("init_ms", "init_growth"), ("p50_ms", "p50_growth")):
+                row[growth] = row[column] / last[column] if last is not None and last[column] > 0 else ""
+            previous[row["backend"]] = row
+
+    def write_table(self, rows, filename):
+        with open(filename, 'w') as f:
+            f.write("\t".join(COLUMNS) + "\n")
+            for row in rows:
+                f.write("\t".join(("%.4g" % row[c]) if isinstance(row[c], float) else str(row[c]) for c in COLUMNS) + "\n")
+
+    def plot(self, rows, filename):
+        try:
+            import matplotlib
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except ImportError:
+            return False
+        fig, axes = plt.subplots(1, 2, figsize=(11, 4))
+        for backend in sorted(set(row["backend"] for row in rows)):
+            points = [row for row in rows if row["backend"] == backend]
+            edges = [2 ** int(row["scale"][2:]) for row in points]
+            axes[0].loglog(edges, [max(row["init_ms"], 1e-3) for row in points], marker='o', label=backend)
+            axes[1].loglog(edges, [max(row["p50_ms"], 1e-3) for row in points], marker='o', label=backend)
+        axes[0].set_title("initial MST time (ms)")
+        axes[1].set_title("median update latency (ms)")
+        for axis in axes:
+            axis.set_xlabel("edges")
+            axis.legend()
+        fig.tight_layout()
+        fig.savefig(filename)
+        return True
+
+    def main(self):
+        options = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+        scales = options.get('-scales', ",".join(SCALES)).split(',')
+        backends = options.get('-backends', 'kruskal,boruvka').split(',')
+        workers = int(options.get('-workers', '1'))
+        here = os.path.dirname(os.path.abspath(__file__))
+        data = options.get('-data', os.path.join(here, "..", "data"))
+        out = options.get('-out', "benchmark")
+        os.makedirs(os.path.join(out, "runs"), exist_ok=True)
+        generator = Generate_RMAT()
+
+        rows = []
+        for scale in scales:
+            graph_file = os.path.join(data, "rmat" + scale + ".gr")
+            change_file = os.path.join(data, "rmat" + scale + ".extra")
+            if not (os.path.exists(graph_file) and os.path.exists(change_file)):
+                generator.generate(int(scale[:2]), int(scale[2:]), data, seed=int(options.get('-seed', '1')),
+                                   changes=int(options.get('-changes', '1000')), delete=float(options.get('-delete', '0.0')),
+                                   reweight=float(options.get('-reweight', '0.0')))
+            # the baseline numbers of hw2 (their peak memory was not recorded)
+            baseline = os.path.join(here, "results", "rmat" + scale + "_output.txt")
+            if os.path.exists(baseline):
+                row = self.summarize(self.read_output(baseline), float('nan'))
+                row.update(scale=scale, backend="hw2 results")
+                rows.append(row)
+            for backend in backends:
+                start = time.time()
+                row = self.run_once(graph_file, change_file, os.path.join(out, "runs", "rmat" + scale + "_" + backend + ".txt"), backend, workers)
+                if row is None:
+                    continue
+                row.update(scale=scale, backend=backend)
+                rows.append(row)
+                print("%s %-8s init %.1f ms, p50 %.3f ms, p99 %.3f ms, %.0f updates/s, %.0f MB (%.1f s)" % (
+                    scale, backend, row["init_ms"], row["p50_ms"], row["p99_ms"], row["updates_per_s"], row["peak_mb"], time.time() - start))
+
+        self.add_growth(rows)
+        self.write_table(rows, os.path.join(out, "summary.tsv"))
+        if self.plot(rows, os.path.join(out, "scaling.png")):
+            print("plot: " + os.path.join(out, "scaling.png"))
+        print("table: " + os.path.join(out, "summary.tsv"))
+
+if __name__ == '__main__':
+    Run_Benchmark().main()
@@ -1,134 +1,627 @@
-#!/usr/bin/python
-# CSE6140 HW2
-# This is an example of how your experiments should look like.
-# Feel free to use and modify the code below, or write your own experimental code, as long as it produces the desired output.
-# datafile: Nx3, u,v,weight
-# Kruskal's algorithm:
-
-import time
-import sys
-class Run_Experiment:
-    def parse_edges(self, filename):
-        # Write this function to parse edges from graph file to create your graph object
-        with open(filename) as graphfile:
-            edge_list = []
-            count = 0
-            for line in graphfile:
-                edge = line.split()
-                if count == 0:  
-                    N,E = int(edge[0]),int(edge[1]) # first line: N=number of vertices, E=number of edges
-                    #print(N,E)
-                else:
-                    v1 = int(edge[0])
-                    v2 = int(edge[1])
-                    w = int(edge[2])     # vertice1, vertice2, weight
-                    edge_list.append((v1,v2,w)) 
-                count = count + 1
-            #print(edge_list)
-        return N,E,edge_list
-    
-    def computeMST(self,N,edge_list):       
-        edge_list.sort(key=lambda tup: tup[2])  # sort in terms of ascending weight of edges
-        # foreach node, the initial root is itself,D-D, A-A, C-C
-        # initial rank is 0
-        root = dict((i,i) for i in range(N))  # for further identifying its component, whether they share the same root
-        rank = dict((i,0) for i in range(N))    # number of nodes in the tree, ini=0
-        # print(root)
-        # print(rank)
-
-        def find(vertice):   ##### recursively find its 'ultimate' root
-            while root[vertice] != vertice:
-                vertice = root[vertice]
-            return vertice
-        
-        def union(root1, root2):    # merge two components in terms of root's rank
-            # attach smaller rank root to higher rank root
-            if rank[root1] > rank[root2]:
-                root[root2] = root1
-
-            # if rank the same, attach one to anotherand increment rank by one    
-            elif rank[root1] == rank[root2]:
-                root[root2] = root1
-                rank[root1] =  rank[root1] + 1
-                
-            # same as first case    
-            else:    
-                root[root1] = root2
-                
-        mst = []
-        mst_wt = 0
-        mst_edge = 0
-        
-        j = 0
-        while(mst_edge < N-1):# Kruskal's: not forming cycle (at most N-1 edges)     
-            vertice1, vertice2, weight = edge_list[j]
-            root1 = find(vertice1)  # find the ultimate root and 
-            root2 = find(vertice2)
-            
-            if root1!= root2:  # if from different component AND not cycle
-                # print("union")
-                union(root1, root2)    # merge    
-                mst.append((vertice1, vertice2, weight))
-                mst_edge = mst_edge + 1
-                mst_wt = mst_wt + weight
-            j = j + 1   
-        return mst_wt,mst   # careful with the order of return variables
-   		
-    def recomputeMST(self,u, v, weight,N,mst):
-        edge_list = mst.copy()
-        edge_list.append((u,v,weight))    
-        new_mst_wt,new_mst = self.computeMST(N,edge_list)   
-        return new_mst_wt,new_mst
-    
-    def main(self):
-
-        num_args = len(sys.argv)
-
-        if num_args < 4:
-            print ("error: not enough input arguments")
-            exit(1)
-
-        graph_file = sys.argv[1]
-        change_file = sys.argv[2]
-        output_file = sys.argv[3]
-
-        #Construct graph
-        
-        N,E,edge_list = self.parse_edges(graph_file)
-
-        start_MST = time.time() #time in seconds
-        MSTweight,mst = self.computeMST(N,edge_list) #call MST function to return total weight of MST
-        total_time = (time.time() - start_MST) * 1000 #to convert to milliseconds
-
-        #Write initial MST weight and time to file
-        output = open(output_file, 'w')
-        output.write(str(MSTweight) + " " + str(total_time)+'\n')
-
-        #Changes file
-        with open(change_file, 'r') as changes:
-            num_changes = changes.readline()
-
-            for line in changes:
-                #parse edge and weight
-                edge_data = list(map(lambda x: int(x), line.split()))
-                assert(len(edge_data) == 3)
-
-                u,v,weight = edge_data[0], edge_data[1], edge_data[2]
-
-                #call recomputeMST function
-                start_recompute = time.time()
-                new_weight,new_mst = self.recomputeMST(u, v, weight,N,mst)
-                total_recompute = (time.time() - start_recompute) * 1000 # to convert to milliseconds
-
-                # for the next iteration
-                mst=new_mst.copy()
-                
-                #write new weight and time to output file
-                output.write(str(new_weight) + " " + str(total_recompute)+'\n')
-                
-        output.close()
-
-if __name__ == '__main__':
-    # run the experiments
-    runexp = Run_Experiment()
+#!/usr/bin/python
+# CSE6140 HW2
+# This is an example of how your experiments should look like.
+# Feel free to use and modify the code below, or write your own experimental code, as long as it produces the desired output.
+# datafile: Nx3, u,v,weight
+# Kruskal's algorithm:
+
+import time
+import sys
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+try:
+    import numpy as np      # bulk parsing and sorting of the edges; the plain Python path below is used without it
+except ImportError:
+    np = None
+
+# Link-cut tree over nodes 0..size-1 (Sleator-Tarjan): each preferred path is a splay tree keyed by depth, so
+# link, cut and "max weight node on the u-v path" are all amortized O(log N).
+# Vertices are nodes with weight -inf, every tree edge gets its own node in between its two ends, so the path max is an edge.
+class LinkCutTree:
+    def __init__(self, size):
+        self.left = [-1] * size
+        self.right = [-1] * size
+        self.parent = [-1] * size
+        self.flip = bytearray(size)     # lazy "reverse this subtree" flag (used by make_root)
+        self.val = [float('-inf')] * size
+        self.mx = list(range(size))     # node with the max val in the splay subtree
+
+    def is_root(self, x):   # x is the root of its splay tree (its parent pointer is a path-parent pointer)
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def push(self, x):
+        if self.flip[x]:
+            left, right, flip = self.left, self.right, self.flip
+            left[x], right[x] = right[x], left[x]
+            if left[x] != -1:
+                flip[left[x]] ^= 1
+            if right[x] != -1:
+                flip[right[x]] ^= 1
+            flip[x] = 0
+
+    def update(self, x):
+        val, mx = self.val, self.mx
+        best = x
+        l = self.left[x]
+        r = self.right[x]
+        if l != -1 and val[mx[l]] > val[best]:
+            best = mx[l]
+        if r != -1 and val[mx[r]] > val[best]:
+            best = mx[r]
+        mx[x] = best
+
+    def rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        # hook x into p's place (g keeps a path-parent pointer if p was a splay root)
+        if g != -1:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] != -1:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] != -1:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self.update(p)
+        self.update(x)
+
+    def splay(self, x):
+        # push the pending flips down from the splay root to x first
+        path = [x]
+        y = x
+        while not self.is_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self.push(y)
+        while not self.is_root(x):
+            p = self.parent[x]
+            if not self.is_root(p):
+                g = self.parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):   # zig-zig
+                    self.rotate(p)
+                else:                                            # zig-zag
+                    self.rotate(x)
+            self.rotate(x)
+
+    def access(self, x):    # make the root-to-x path preferred, x ends up as root of its splay tree
+        last = -1
+        y = x
+        while y != -1:
+            self.splay(y)
+            self.right[y] = last
+            self.update(y)
+            last = y
+            y = self.parent[y]
+        self.splay(x)
+
+    def make_root(self, x):
+        self.access(x)
+        self.flip[x] ^= 1
+        self.push(x)
+
+    def find_root(self, x):
+        self.access(x)
+        self.push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self.push(x)
+        self.splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):   # x and y must be in different trees
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):    # x and y must be adjacent
+        self.make_root(x)
+        self.access(y)
+        # x is now the only node left of y in y's splay tree
+        self.left[y] = -1
+        self.parent[x] = -1
+        self.update(y)
+
+    def path_max(self, x, y):   # node with the max val on the x-y path (x and y must be connected)
+        self.make_root(x)
+        self.access(y)
+        return self.mx[y]
+
+# MST (spanning forest) kept up to date under edge insertions, deletions and weight changes.
+# The tree edges live in a link-cut tree: node N + i holds the i-th edge slot, slots of removed edges are reused, so the tree needs 2N nodes.
+# self.mst is the list of tree edges (u, v, weight); pos[slot] is where the edge of a slot sits in it, so removing an edge is a swap with
+# the last one, O(1). tree_adj[x] maps the tree neighbors of x to the slot of the edge, nontree[x] maps the non-tree neighbors of x to
+# the weight of the edge (the graph is kept simple: parallel edges are merged into the lightest one).
+# Removing a tree edge splits the tree in two; the replacement edge is the lightest non-tree edge leaving the smaller side, which is found
+# by growing both sides at the same speed. The work is O(smaller side + its non-tree edges), which is only small when the cut is lopsided:
+# for a balanced cut it is O(N + E) per deletion or weight increase, no better than running computeMST again. Insertions and weight
+# decreases stay O(log N).
+class DynamicMST:
+    def __init__(self, N, mst, edge_list=None):
+        self.N = N
+        self.lct = LinkCutTree(2 * N)
+        self.mst = []
+        self.slot_of = []       # slot of the edge at each position of self.mst
+        self.pos = [-1] * N
+        self.free_slots = list(range(N - 1, -1, -1))
+        self.weight = 0
+        self.tree_adj = [dict() for i in range(N)]
+        self.nontree = [dict() for i in range(N)]
+        for u, v, weight in mst:
+            self.add_slot(u, v, weight)
+        self.build_forest()
+        # every other edge of the graph is a non-tree edge
+        if edge_list is not None:
+            us, vs, ws = edge_list
+            if np is not None:
+                us, vs, ws = np.asarray(us).tolist(), np.asarray(vs).tolist(), np.asarray(ws).tolist()
+            tree_adj, nontree = self.tree_adj, self.nontree
+            for u, v, weight in zip(us, vs, ws):
+                if u == v or v in tree_adj[u]:
+                    continue
+                if nontree[u].get(v, weight) >= weight:
+                    nontree[u][v] = weight
+                    nontree[v][u] = weight
+
+    def add_slot(self, u, v, weight):   # record a tree edge (without touching the link-cut tree)
+        slot = self.free_slots.pop()
+        node = self.N + slot
+        self.lct.val[node] = weight
+        self.lct.mx[node] = node
+        self.tree_adj[u][v] = slot
+        self.tree_adj[v][u] = slot
+        self.pos[slot] = len(self.mst)
+        self.mst.append((u, v, weight))
+        self.slot_of.append(slot)
+        self.weight = self.weight + weight
+        return node
+
+    def build_forest(self):
+        # the initial link-cut tree is just the rooted forest: every node is its own splay tree and points to its tree parent,
+        # which is built in O(N) instead of 2(N-1) links
+        parent = self.lct.parent
+        seen = bytearray(self.N)
+        for r in range(self.N):
+            if seen[r]:
+                continue
+            seen[r] = 1
+            stack = [r]
+            while stack:
+                x = stack.pop()
+                for y, slot in self.tree_adj[x].items():
+                    if not seen[y]:
+                        seen[y] = 1
+                        parent[y] = self.N + slot
+                        parent[self.N + slot] = x
+                        stack.append(y)
+
+    def add_edge(self, u, v, weight):
+        node = self.add_slot(u, v, weight)
+        self.lct.link(u, node)
+        self.lct.link(node, v)
+
+    def remove_slot(self, slot):
+        i = self.pos[slot]
+        u, v, weight = self.mst[i]
+        node = self.N + slot
+        self.lct.cut(u, node)
+        self.lct.cut(node, v)
+        self.lct.val[node] = float('-inf')
+        del self.tree_adj[u][v]
+        del self.tree_adj[v][u]
+        # move the last edge into position i
+        last = len(self.mst) - 1
+        self.mst[i] = self.mst[last]
+        self.slot_of[i] = self.slot_of[last]
+        self.pos[self.slot_of[i]] = i
+        self.mst.pop()
+        self.slot_of.pop()
+        self.pos[slot] = -1
+        self.free_slots.append(slot)
+        self.weight = self.weight - weight
+        return u, v, weight
+
+    def add_nontree(self, u, v, weight):
+        self.nontree[u][v] = weight
+        self.nontree[v][u] = weight
+
+    def remove_nontree(self, u, v):
+        del self.nontree[u][v]
+        del self.nontree[v][u]
+
+    def insert(self, u, v, weight):
+        # new edge closes a cycle: it replaces the heaviest edge on the tree path u-v if it is lighter (the loser becomes a non-tree edge)
+        if u == v:
+            return self.weight
+        if v in self.tree_adj[u] or v in self.nontree[u]:
+            # the edge is already there: a parallel edge only matters if it is lighter
+            if weight < self.edge_weight(u, v):
+                self.change_weight(u, v, weight)
+            return self.weight
+        lct = self.lct
+        if lct.connected(u, v):
+            node = lct.path_max(u, v)
+            if lct.val[node] <= weight:
+                self.add_nontree(u, v, weight)
+                return self.weight
+            self.add_nontree(*self.remove_slot(node - self.N))
+        self.add_edge(u, v, weight)
+        return self.weight
+
+    def edge_weight(self, u, v):
+        if v in self.tree_adj[u]:
+            return self.mst[self.pos[self.tree_adj[u][v]]][2]
+        return self.nontree[u][v]
+
+    def delete(self, u, v):
+        if v in self.nontree[u]:
+            self.remove_nontree(u, v)
+        elif v in self.tree_adj[u]:
+            self.remove_slot(self.tree_adj[u][v])
+            self.replace(u, v)
+        return self.weight
+
+    def change_weight(self, u, v, weight):
+        if v in self.nontree[u]:
+            # a lighter non-tree edge may now beat the heaviest edge on its cycle
+            if weight < self.nontree[u][v]:
+                self.remove_nontree(u, v)
+                return self.insert(u, v, weight)
+            self.add_nontree(u, v, weight)
+        elif v in self.tree_adj[u]:
+            slot = self.tree_adj[u][v]
+            old = self.mst[self.pos[slot]][2]
+            if weight <= old:
+                # a lighter tree edge stays in the tree: update its node (splayed to the root first, so no aggregate above it is stale)
+                node = self.N + slot
+                self.lct.access(node)
+                self.lct.val[node] = weight
+                self.lct.update(node)
+                self.mst[self.pos[slot]] = (self.mst[self.pos[slot]][0], self.mst[self.pos[slot]][1], weight)
+                self.weight = self.weight - old + weight
+            else:
+                # a heavier tree edge competes with the other edges across its cut
+                self.remove_slot(slot)
+                self.add_nontree(u, v, weight)
+                self.replace(u, v)
+        return self.weight
+
+    def replace(self, u, v):
+        # u and v were just separated: link the lightest non-tree edge leaving the smaller of their two trees (if there is one).
+        # O(smaller side + its non-tree edges), i.e. O(N + E) when the two trees are about the same size
+        side = self.smaller_side(u, v)
+        best = None
+        for x in side:
+            for y, weight in self.nontree[x].items():
+                if y not in side and (best is None or weight < best[0]):
+                    best = (weight, x, y)
+        if best is not None:
+            weight, x, y = best
+            self.remove_nontree(x, y)
+            self.add_edge(x, y, weight)
+
+    def smaller_side(self, u, v):
+        # grow the trees of u and v one vertex at a time each and return the vertex set of the one that runs out first
+        tree_adj = self.tree_adj
+        queues = ([u], [v])
+        seen = ({u}, {v})
+        heads = [0, 0]
+        while True:
+            for k in (0, 1):
+                if heads[k] == len(queues[k]):
+                    return seen[k]
+                x = queues[k][heads[k]]
+                heads[k] += 1
+                for y in tree_adj[x]:
+                    if y not in seen[k]:
+                        seen[k].add(y)
+                        queues[k].append(y)
+
+# Boruvka workers: each one attaches the shared edge arrays once (u, v, rank of every edge, component of every vertex)
+# and computes the lightest edge leaving every component over its shard of the edges into its own row of the shared "best" array
+boruvka_shared = {}
+
+def boruvka_init(names, N, E, workers):
+    for name, shape in (('u', E), ('v', E), ('key', E), ('comp', N), ('best', workers * N)):
+        shm = shared_memory.SharedMemory(name=names[name])
+        boruvka_shared[name + '_shm'] = shm     # keep the mapping alive
+        boruvka_shared[name] = np.ndarray(shape, dtype=np.int64, buffer=shm.buf)
+    boruvka_shared['best'] = boruvka_shared['best'].reshape(workers, N)
+
+def boruvka_shard(task):
+    k, lo, hi = task
+    s = boruvka_shared
+    comp = s['comp']
+    cu = comp[s['u'][lo:hi]]
+    cv = comp[s['v'][lo:hi]]
+    cross = cu != cv
+    key = s['key'][lo:hi][cross]
+    best = s['best'][k]
+    best.fill(np.iinfo(np.int64).max)
+    np.minimum.at(best, cu[cross], key)
+    np.minimum.at(best, cv[cross], key)
+    return int(key.size)
+
+class Run_Experiment:
+    dynamic = None      # DynamicMST engine used by recomputeMST
+
+    def parse_edges(self, filename):
+        # Parse the whole graph file at once into three flat columns u, v, weight (no tuple per edge)
+        with open(filename, 'rb') as graphfile:
+            header = graphfile.readline().split()
+            N,E = int(header[0]),int(header[1]) # first line: N=number of vertices, E=number of edges
+            if np is not None:
+                data = np.fromstring(graphfile.read(), dtype=np.int64, sep=' ')
+                data = data[:len(data) // 3 * 3].reshape(-1, 3)
+                edge_list = (data[:, 0].astype(np.int32), data[:, 1].astype(np.int32), data[:, 2].copy())
+            else:
+                data = array('q', map(int, graphfile.read().split()))
+                edge_list = (array('i', data[0::3]), array('i', data[1::3]), data[2::3])
+        return N,E,edge_list
+    
+    def computeMST(self,N,edge_list):
+        # edge_list is the (u, v, weight) columns from parse_edges (a list of (u, v, weight) tuples works too)
+        if isinstance(edge_list, list):
+            edge_list = tuple(array('q', column) for column in zip(*edge_list)) if edge_list else (array('q'), array('q'), array('q'))
+        us, vs, ws = edge_list
+        # sort the edge indices by ascending weight (stable, so equal weights keep the file order like list.sort did)
+        if np is not None:
+            order = np.argsort(np.asarray(ws), kind='stable')
+        else:
+            order = sorted(range(len(ws)), key=ws.__getitem__)
+
+        # union-find on flat lists: root[i] is the parent of i, rank[i] bounds the height of i's tree
+        root = list(range(N))
+        rank = [0] * N
+
+        mst = []
+        mst_wt = 0
+        mst_edge = 0
+        
+        # Kruskal's: not forming cycle (at most N-1 edges); the sorted edges are taken in chunks so only a chunk is ever unpacked into Python ints
+        chunk = 1 << 16
+        for start in range(0, len(order), chunk):
+            if mst_edge >= N - 1:
+                break
+            if np is not None:
+                idx = order[start:start + chunk]
+                rows = zip(np.asarray(us)[idx].tolist(), np.asarray(vs)[idx].tolist(), np.asarray(ws)[idx].tolist())
+            else:
+                rows = ((us[i], vs[i], ws[i]) for i in order[start:start + chunk])
+            for vertice1, vertice2, weight in rows:
+                # find the ultimate roots, halving the paths on the way (path compression)
+                root1 = vertice1
+                while root[root1] != root1:
+                    root[root1] = root[root[root1]]
+                    root1 = root[root1]
+                root2 = vertice2
+                while root[root2] != root2:
+                    root[root2] = root[root[root2]]
+                    root2 = root[root2]
+                
+                if root1 != root2:  # if from different component AND not cycle
+                    # union by rank: attach the lower rank root to the higher rank root
+                    if rank[root1] < rank[root2]:
+                        root1, root2 = root2, root1
+                    root[root2] = root1
+                    if rank[root1] == rank[root2]:
+                        rank[root1] = rank[root1] + 1
+                    mst.append((vertice1, vertice2, weight))
+                    mst_edge = mst_edge + 1
+                    mst_wt = mst_wt + weight
+                    if mst_edge >= N - 1:
+                        break
+        return mst_wt,mst   # careful with the order of return variables
+   		
+    def computeMST_boruvka(self,N,edge_list,workers=1):
+        # Boruvka: every round each component picks its lightest outgoing edge (a segment min over the edges), the picked edges are added
+        # and the components they join are contracted, so there are at most log N rounds.
+        # Edges are compared by weight * E + index, which orders them exactly like Kruskal's stable sort (so the MST is the same edge set,
+        # and it is returned in that order too: same (mst_wt, mst) as computeMST) without sorting all the edges.
+        # With workers > 1 the edges are split into shards over a process pool working on shared-memory arrays.
+        if np is None:
+            print("error: the boruvka backend needs numpy")
+            exit(1)
+        if isinstance(edge_list, list):
+            edge_list = tuple(np.array(column, dtype=np.int64) for column in zip(*edge_list)) if edge_list else (np.zeros(0, np.int64),) * 3
+        us = np.asarray(edge_list[0], dtype=np.int64)
+        vs = np.asarray(edge_list[1], dtype=np.int64)
+        ws = np.asarray(edge_list[2], dtype=np.int64)
+        E = len(ws)
+        INF = np.iinfo(np.int64).max
+        if E > 0 and int(ws.max()) < (INF - E) // E and int(ws.min()) >= 0:
+            key = ws * E + np.arange(E, dtype=np.int64)
+            order = None
+        else:
+            # weights too large for the packed key: fall back to the rank in the stable weight order
+            order = np.argsort(ws, kind='stable')    # order[rank] = edge
+            key = np.empty(E, dtype=np.int64)
+            key[order] = np.arange(E)
+        comp = np.arange(N, dtype=np.int64)     # component (representative vertex) of every vertex
+        vertices = np.arange(N, dtype=np.int64)
+        picked = []
+
+        pool = None
+        shms = []
+        if workers > 1 and E > 0:
+            # put the edge arrays, the components and one "best" row per worker in shared memory
+            names = {}
+            arrays = {}
+            for name, source in (('u', us), ('v', vs), ('key', key), ('comp', comp), ('best', np.zeros(workers * N, np.int64))):
+                shm = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+                shms.append(shm)
+                names[name] = shm.name
+                arrays[name] = np.ndarray(source.shape, dtype=np.int64, buffer=shm.buf)
+                arrays[name][:] = source
+            shared_comp = arrays['comp']
+            shared_best = arrays['best'].reshape(workers, N)
+            shard = (E + workers - 1) // workers
+            tasks = [(k, k * shard, min((k + 1) * shard, E)) for k in range(workers)]
+            pool = multiprocessing.Pool(workers, initializer=boruvka_init, initargs=(names, N, E, workers))
+        else:
+            eu, ev, ek = us, vs, key
+
+        try:
+            while True:
+                if pool is not None:
+                    shared_comp[:] = comp
+                    if sum(pool.map(boruvka_shard, tasks)) == 0:
+                        break
+                    best = shared_best.min(axis=0)
+                else:
+                    # contract: drop the edges inside a component for good
+                    cu = comp[eu]
+                    cv = comp[ev]
+                    cross = cu != cv
+                    if not cross.any():
+                        break
+                    eu, ev, ek, cu, cv = eu[cross], ev[cross], ek[cross], cu[cross], cv[cross]
+                    best = np.full(N, INF, dtype=np.int64)
+                    np.minimum.at(best, cu, ek)
+                    np.minimum.at(best, cv, ek)
+                # every component with an outgoing edge points at the component across its lightest edge
+                has = np.nonzero(best != INF)[0]
+                edges = best[has] % E if order is None else order[best[has]]
+                cu = comp[us[edges]]
+                other = np.where(cu == has, comp[vs[edges]], cu)
+                parent = vertices.copy()
+                parent[has] = other
+                picked.append(best[has])
+                # two components that picked the same edge point at each other: the smaller one becomes the root
+                mutual = (parent[parent] == vertices) & (parent != vertices) & (vertices < parent)
+                parent[mutual] = vertices[mutual]
+                # pointer jumping until every component points at its root
+                while True:
+                    jumped = parent[parent]
+                    if np.array_equal(jumped, parent):
+                        break
+                    parent = jumped
+                comp = parent[comp]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            for shm in shms:
+                shm.close()
+                shm.unlink()
+
+        # two components may have picked the same edge
+        keys = np.unique(np.concatenate(picked)) if picked else np.zeros(0, np.int64)
+        edges = keys % max(E, 1) if order is None else order[keys]
+        mst_w = ws[edges].tolist()
+        mst = list(zip(us[edges].tolist(), vs[edges].tolist(), mst_w))
+        return sum(mst_w),mst
+
+    def recomputeMST(self,u, v, weight,N,mst):
+        # the link-cut tree is built once from the MST and then updated in O(log N) per new edge;
+        # the returned MST is the engine's own edge list (updated in place), so passing it back in keeps using the same engine
+        if self.dynamic is None or self.dynamic.mst is not mst:
+            self.dynamic = DynamicMST(N, mst)
+        new_mst_wt = self.dynamic.insert(u, v, weight)
+        return new_mst_wt,self.dynamic.mst
+
+    def deleteMST(self, u, v, N, mst):
+        # delete the edge (u, v); a deleted tree edge is replaced by the lightest non-tree edge across the cut it leaves
+        if self.dynamic is None or self.dynamic.mst is not mst:
+            self.dynamic = DynamicMST(N, mst)
+        new_mst_wt = self.dynamic.delete(u, v)
+        return new_mst_wt,self.dynamic.mst
+
+    def reweightMST(self, u, v, weight, N, mst):
+        # set the weight of the edge (u, v) (increases of tree edges and decreases of non-tree edges can change the MST)
+        if self.dynamic is None or self.dynamic.mst is not mst:
+            self.dynamic = DynamicMST(N, mst)
+        new_mst_wt = self.dynamic.change_weight(u, v, weight)
+        return new_mst_wt,self.dynamic.mst
+    
+    def main(self):
+
+        num_args = len(sys.argv)
+
+        if num_args < 4:
+            print ("error: not enough input arguments")
+            exit(1)
+
+        graph_file = sys.argv[1]
+        change_file = sys.argv[2]
+        output_file = sys.argv[3]
+
+        #Optional: -mst kruskal|boruvka selects the initial MST backend, -workers N the number of Boruvka processes
+        options = dict(zip(sys.argv[4::2], sys.argv[5::2]))
+        backend = options.get('-mst', 'kruskal')
+        workers = int(options.get('-workers', '1'))
+        if backend not in ('kruskal', 'boruvka'):
+            print ("error: unknown MST backend " + backend)
+            exit(1)
+
+        #Construct graph
+        
+        N,E,edge_list = self.parse_edges(graph_file)
+
+        start_MST = time.time() #time in seconds
+        if backend == 'boruvka':
+            MSTweight,mst = self.computeMST_boruvka(N,edge_list,workers)
+        else:
+            MSTweight,mst = self.computeMST(N,edge_list) #call MST function to return total weight of MST
+        total_time = (time.time() - start_MST) * 1000 #to convert to milliseconds
+
+        #Write initial MST weight and time to file
+        output = open(output_file, 'w')
+        output.write(str(MSTweight) + " " + str(total_time)+'\n')
+
+        #Build the link-cut tree of the MST and the index of the non-tree edges once before the updates (not part of the update times)
+        self.dynamic = DynamicMST(N, mst, edge_list)
+        mst = self.dynamic.mst
+
+        #Changes file
+        with open(change_file, 'r') as changes:
+            num_changes = changes.readline()
+
+            for line in changes:
+                #parse the change: "u v weight" inserts an edge, "d u v" deletes one, "w u v weight" sets the weight of one
+                fields = line.split()
+                if not fields:
+                    continue
+                op = fields[0] if fields[0] in ('d', 'w') else 'i'
+                edge_data = list(map(lambda x: int(x), fields[1:] if op != 'i' else fields))
+                assert(len(edge_data) == (2 if op == 'd' else 3))
+
+                u,v = edge_data[0], edge_data[1]
+                weight = edge_data[2] if op != 'd' else None
+
+                #call the update function of the change
+                start_recompute = time.time()
+                if op == 'i':
+                    new_weight,new_mst = self.recomputeMST(u, v, weight,N,mst)
+                elif op == 'd':
+                    new_weight,new_mst = self.deleteMST(u, v, N, mst)
+                else:
+                    new_weight,new_mst = self.reweightMST(u, v, weight, N, mst)
+                total_recompute = (time.time() - start_recompute) * 1000 # to convert to milliseconds
+
+                # for the next iteration (no copy, the dynamic MST keeps updating this list)
+                mst=new_mst
+                
+                #write new weight and time to output file
+                output.write(str(new_weight) + " " + str(total_recompute)+'\n')
+                
+        output.close()
+
+if __name__ == '__main__':
+    # run the experiments
+    runexp = Run_Experiment()
     runexp.main()
\ No newline at end of file